@@ -0,0 +1,44 @@
+"""
+Chrome Launcher Module
+Opens eBay pages as tabs of a single Chrome window
+"""
+
+import os
+import shutil
+import functools
+import subprocess
+import webbrowser
+
+# Windows-only process flag; 0 elsewhere so Popen accepts it
+_DETACHED_PROCESS = getattr(subprocess, 'DETACHED_PROCESS', 0)
+
+
+@functools.lru_cache(maxsize=None)
+def find_chrome():
+    """Locate chrome.exe once so it can be launched without going through cmd.exe."""
+    found = shutil.which('chrome')
+    if found:
+        return found
+    for env_var in ('PROGRAMFILES', 'PROGRAMFILES(X86)', 'LOCALAPPDATA'):
+        base = os.environ.get(env_var)
+        if base:
+            path = os.path.join(base, 'Google', 'Chrome', 'Application', 'chrome.exe')
+            if os.path.exists(path):
+                return path
+    return None
+
+
+def launch_chrome(urls, new_window=False):
+    """Open URLs as tabs of a single Chrome invocation (in tab order)."""
+    # --new-window keeps the batch in its own window instead of piling onto the last one
+    window_args = ['--new-window'] if new_window else []
+    chrome = find_chrome()
+    if chrome:
+        # Detached so Chrome does not attach to (or close with) this console
+        subprocess.Popen([chrome, *window_args, *urls], close_fds=True,
+                         creationflags=_DETACHED_PROCESS)
+    else:
+        # Not found on disk - hand the URLs to the default browser. No shell is
+        # involved, so an '&' in a Seller Hub URL can't split a command
+        for i, url in enumerate(urls):
+            webbrowser.open(url, new=1 if new_window and i == 0 else 2)
@@ -17,9 +17,14 @@ Workflow:
     3. Run with --done to mark complete and get next batch
 """
 import os
+import re
 import sys
-import subprocess
+import bisect
+import argparse
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from outlook_reader import OutlookReader
+from chrome_launcher import launch_chrome
 from email_parser import EmailParser
 from instruction_parser import InstructionParser, generate_seller_hub_url
 from config import OUTLOOK_CONFIG
@@ -31,22 +36,69 @@ STATS_FILE = os.path.join(os.path.dirname(__file__), 'stats.txt')
 GALLERY_INFO_DIR = os.path.join(os.path.dirname(__file__), 'gallery_info')
 END_LISTING_URL = "https://www.ebay.com/help/action?topicid=4146"
 BUYER_BLOCK_URL = "https://www.ebay.com/bmgt/BuyerBlock"
+EBAY_ITEM_MARKER = "ebay.com/itm/"  # Present in every email EmailParser can match
+EBAY_IMG_MARKER = "i.ebayimg.com/images/"  # Present in every eBay image URL
+_FOLDER_NAME = OUTLOOK_CONFIG['folder_name']
+_ACCOUNT_EMAIL = OUTLOOK_CONFIG['account_email']
+
+# eBay image URLs (bare, and wrapped in <...> by Outlook) and item page URLs
+_EBAY_IMG_RE = re.compile(r'https?://i\.ebayimg\.com/images/[^\s<>"\']+')
+_EBAY_IMG_BRACKET_RE = re.compile(r'<(https?://i\.ebayimg\.com/images/[^>]+)>')
+_EBAY_ITM_RE = re.compile(r'https?://(?:www\.)?ebay\.com/itm/\d+')
+# "block" as a word (block/blocked/blocking), not inside e.g. "blockchain"
+_BLOCK_WORD_RE = re.compile(r'\bblock(?:ed|ing)?\b', re.IGNORECASE)
+
+# HTML-escape an email body and keep its line breaks, in a single pass
+_BODY_HTML_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '\n': '<br>'})
+
+# Parsers are stateless, so one instance serves every call
+_EMAIL_PARSER = EmailParser()
+_INSTRUCTION_PARSER = InstructionParser()
+
+# Display order of title-revision action groups
+ACTION_RANK = {name: i for i, name in enumerate(
+    ["ADD SILVER", "NEW TITLE", "END LISTING", "OTHER", "CHECK EMAIL"])}
+
+# Table text for each title-revision action; anything else shows its detail as-is
+ACTION_FMT = {
+    "ADD SILVER": lambda l: "Add 'Silver' after 'Sterling'",
+    "NEW TITLE": lambda l: "NEW TITLE: " + l['action_detail'].replace('\n', ' '),
+    "END LISTING": lambda l: "END/REMOVE THIS LISTING",
+}
+
+# Report separator lines
+_SEP_EQ70 = "=" * 70
+_SEP_EQ40 = "=" * 40
+_SEP_DASH70 = "-" * 70
+_SEP_DASH50 = "-" * 50
+_SEP_BANG70 = "!" * 70
+_SEP_STAR70 = "*" * 70
+_SEP_HASH60 = "#" * 60
+_SEP_BOX16 = "+" + "-" * 16 + "+"  # Top/bottom of the item-number box
+
+# In-process copy of completed_items.txt, reloaded only when the file's mtime changes
+_completed_cache = None
+_completed_mtime = None
+
+
+def _emit(lines):
+    """Write buffered report lines to stdout in a single call."""
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def has_gallery_photo_instruction(listing):
     """Check if a listing has gallery photo change instructions."""
-    notes_text = ' '.join(listing.get('notes', []) or []).lower()
-    body_text = listing.get('body_preview', '').lower()
-    return 'gallery photo' in notes_text or 'gallery photo' in body_text
+    body_text = listing.get('body_lower')
+    if body_text is None:
+        body_text = listing.get('body_preview', '').lower()
+    return ('gallery photo' in body_text
+            or any('gallery photo' in note.lower() for note in listing.get('notes') or []))
 
 
 def create_gallery_info_page(listing):
     """Create an HTML info page for gallery photo instructions."""
-    import re
-
-    # Ensure directory exists
-    if not os.path.exists(GALLERY_INFO_DIR):
-        os.makedirs(GALLERY_INFO_DIR)
+    # Ensure directory exists (exist_ok: pages may be created from several threads)
+    os.makedirs(GALLERY_INFO_DIR, exist_ok=True)
 
     item_id = listing['item_id']
     title = listing.get('title', 'Unknown Item')
@@ -54,30 +106,25 @@ def create_gallery_info_page(listing):
     notes = listing.get('notes', []) or []
 
     # Extract image URLs from the body (eBay image URLs)
-    image_urls = re.findall(r'https?://i\.ebayimg\.com/images/[^\s<>"\']+', body)
-    # Also check for URLs in angle brackets like <https://...>
-    bracketed_urls = re.findall(r'<(https?://i\.ebayimg\.com/images/[^>]+)>', body)
-    image_urls.extend(bracketed_urls)
-    # Remove duplicates while preserving order
-    seen = set()
+    # (also URLs in angle brackets like <https://...>), de-duplicated in order
     unique_images = []
-    for url in image_urls:
-        if url not in seen:
-            seen.add(url)
-            unique_images.append(url)
+    if EBAY_IMG_MARKER in body:
+        unique_images = list(dict.fromkeys(
+            _EBAY_IMG_RE.findall(body) + _EBAY_IMG_BRACKET_RE.findall(body)))
 
     # Build image HTML
     images_html = ""
     if unique_images:
-        images_html = '<div class="images"><h3>Photo to Use as Gallery Photo:</h3>'
+        parts = ['<div class="images"><h3>Photo to Use as Gallery Photo:</h3>']
         for img_url in unique_images:
             # Convert thumbnail URL to larger version if possible
             large_url = img_url.replace('/s-l140.', '/s-l500.').replace('/s-l64.', '/s-l500.')
-            images_html += f'<img src="{large_url}" alt="Gallery photo" style="max-width:100%; border:2px solid #ff6600; border-radius:8px; margin:10px 0;">'
-        images_html += '</div>'
+            parts.append(f'<img src="{large_url}" alt="Gallery photo" style="max-width:100%; border:2px solid #ff6600; border-radius:8px; margin:10px 0;">')
+        parts.append('</div>')
+        images_html = ''.join(parts)
 
     # Escape HTML in body (but preserve line breaks)
-    body_escaped = body.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('\n', '<br>')
+    body_escaped = body.translate(_BODY_HTML_TABLE)
 
     html_content = f"""<!DOCTYPE html>
 <html>
@@ -181,106 +228,143 @@ def create_gallery_info_page(listing):
 </html>"""
 
     filepath = os.path.join(GALLERY_INFO_DIR, f"gallery_info_{item_id}.html")
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    data = html_content.encode('utf-8')
+
+    # Re-runs usually regenerate an identical page; leave that file untouched
+    try:
+        if os.path.getsize(filepath) == len(data):
+            with open(filepath, 'rb') as f:
+                if f.read() == data:
+                    return filepath
+    except OSError:
+        pass
+
+    with open(filepath, 'wb') as f:
+        f.write(data)
 
     return filepath
 
 
+def _write_atomic(path, text):
+    """Replace a file's contents via a temp file so a crash never leaves it truncated."""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def _completed_file_mtime():
+    """Return the completed file's mtime, or None if it does not exist."""
+    try:
+        return os.stat(COMPLETED_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _read_rows(path, missing_ok=False, maxsplit=-1):
+    """Read a small '|'-separated file in one go and split it into rows of fields.
+
+    With missing_ok=True a missing file reads as empty instead of raising.
+    maxsplit caps the split for callers that only use the leading fields.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return [line.strip().split('|', maxsplit) for line in f.read().splitlines() if line.strip()]
+    except FileNotFoundError:
+        if missing_ok:
+            return []
+        raise
+
+
 def load_completed():
-    """Load set of already completed item IDs."""
-    if not os.path.exists(COMPLETED_FILE):
-        return set()
-    with open(COMPLETED_FILE, 'r', encoding='utf-8') as f:
-        return set(line.strip() for line in f if line.strip())
+    """Load set of already completed item IDs (cached until the file changes)."""
+    global _completed_cache, _completed_mtime
+    mtime = _completed_file_mtime()
+    if _completed_cache is None or mtime != _completed_mtime:
+        _completed_cache = set()
+        if mtime is not None:
+            with open(COMPLETED_FILE, 'r', encoding='utf-8') as f:
+                _completed_cache = set(filter(None, map(str.strip, f)))
+        _completed_mtime = mtime
+    return set(_completed_cache)
 
 
 def save_completed(item_ids):
     """Append item IDs to completed file."""
-    with open(COMPLETED_FILE, 'a', encoding='utf-8') as f:
-        for item_id in item_ids:
-            f.write(f"{item_id}\n")
+    global _completed_mtime
+    if item_ids:
+        with open(COMPLETED_FILE, 'a', encoding='utf-8') as f:
+            f.write('\n'.join(item_ids) + '\n')
+    if _completed_cache is not None:
+        # Keep the cache current instead of forcing a reload on the next call
+        _completed_cache.update(item_ids)
+        _completed_mtime = _completed_file_mtime()
     # Update stats
     update_stats(len(item_ids))
 
 
 def remove_from_completed(item_ids):
     """Remove item IDs from completed file (for undo)."""
+    global _completed_mtime
     if not os.path.exists(COMPLETED_FILE):
         return 0
 
-    with open(COMPLETED_FILE, 'r', encoding='utf-8') as f:
-        existing = [line.strip() for line in f if line.strip()]
-
+    # Stream the log into a temp file, dropping the requested IDs, then swap it in
+    ids_to_remove = set(item_ids)
     removed = 0
-    new_list = []
-    for item_id in existing:
-        if item_id in item_ids:
-            removed += 1
-        else:
-            new_list.append(item_id)
+    tmp_path = COMPLETED_FILE + '.tmp'
+    with open(COMPLETED_FILE, 'r', encoding='utf-8') as fin, \
+            open(tmp_path, 'w', encoding='utf-8') as fout:
+        for line in fin:
+            item_id = line.strip()
+            if not item_id:
+                continue
+            if item_id in ids_to_remove:
+                removed += 1
+            else:
+                fout.write(f"{item_id}\n")
+    os.replace(tmp_path, COMPLETED_FILE)
 
-    with open(COMPLETED_FILE, 'w', encoding='utf-8') as f:
-        for item_id in new_list:
-            f.write(f"{item_id}\n")
+    if _completed_cache is not None:
+        _completed_cache.difference_update(ids_to_remove)
+        _completed_mtime = _completed_file_mtime()
 
     return removed
 
 
 def update_stats(count):
-    """Update statistics file with processing count."""
+    """Record a processing count for today in the statistics file.
+
+    Counts are appended as date|count records; show_stats() sums records for
+    the same date and folds them back into one line per day.
+    """
     from datetime import datetime
+    if not count:
+        return
     today = datetime.now().strftime('%Y-%m-%d')
-
-    # Load existing stats
-    stats = {}
-    if os.path.exists(STATS_FILE):
-        with open(STATS_FILE, 'r', encoding='utf-8') as f:
-            for line in f:
-                if '|' in line:
-                    date, cnt = line.strip().split('|')
-                    stats[date] = int(cnt)
-
-    # Update today's count
-    stats[today] = stats.get(today, 0) + count
-
-    # Save stats
-    with open(STATS_FILE, 'w', encoding='utf-8') as f:
-        for date in sorted(stats.keys()):
-            f.write(f"{date}|{stats[date]}\n")
+    with open(STATS_FILE, 'a', encoding='utf-8') as f:
+        f.write(f"{today}|{count}\n")
 
 
 def load_pending_items():
     """Load pending items from both pending files for verification display."""
-    pending_items = []
-
     # Load price pending items
-    if os.path.exists(PENDING_FILE):
-        with open(PENDING_FILE, 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.strip().split('|')
-                if len(parts) >= 3:
-                    pending_items.append({
-                        'entry_id': parts[0],
-                        'item_id': parts[1],
-                        'price': parts[2],
-                        'type': 'PRICE'
-                    })
+    price_items = [{
+        'entry_id': parts[0],
+        'item_id': parts[1],
+        'price': parts[2],
+        'type': 'PRICE'
+    } for parts in _read_rows(PENDING_FILE, missing_ok=True, maxsplit=2) if len(parts) >= 3]
 
     # Load title-only pending items
-    if os.path.exists(TITLE_PENDING_FILE):
-        with open(TITLE_PENDING_FILE, 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.strip().split('|')
-                if len(parts) >= 2:
-                    pending_items.append({
-                        'entry_id': parts[0],
-                        'item_id': parts[1],
-                        'price': 'TITLE_ONLY',
-                        'type': 'TITLE'
-                    })
+    title_items = [{
+        'entry_id': parts[0],
+        'item_id': parts[1],
+        'price': 'TITLE_ONLY',
+        'type': 'TITLE'
+    } for parts in _read_rows(TITLE_PENDING_FILE, missing_ok=True, maxsplit=2) if len(parts) >= 2]
 
-    return pending_items
+    return price_items + title_items
 
 
 def show_pending_verification_table():
@@ -290,14 +374,16 @@ def show_pending_verification_table():
     if not pending_items:
         return False
 
-    print()
-    print("=" * 70)
-    print("PENDING ITEMS FROM PREVIOUS BATCH - Please verify these are done:")
-    print("=" * 70)
-    print()
-    print("+-----+-----------------+----------------+--------+")
-    print("|  #  | Item ID         | Price          | Type   |")
-    print("+-----+-----------------+----------------+--------+")
+    out = []
+    append = out.append
+    append('')
+    append(_SEP_EQ70)
+    append("PENDING ITEMS FROM PREVIOUS BATCH - Please verify these are done:")
+    append(_SEP_EQ70)
+    append('')
+    append("+-----+-----------------+----------------+--------+")
+    append("|  #  | Item ID         | Price          | Type   |")
+    append("+-----+-----------------+----------------+--------+")
 
     for i, item in enumerate(pending_items, 1):
         price_display = item['price'] if item['price'] != 'TITLE_ONLY' else '(title only)'
@@ -306,19 +392,21 @@ def show_pending_verification_table():
                 price_display = f"${float(price_display):.2f}"
             except (ValueError, TypeError):
                 pass
-        print(f"| {i:<3} | {item['item_id']:<15} | {price_display:<14} | {item['type']:<6} |")
-
-    print("+-----+-----------------+----------------+--------+")
-    print()
-    print("If these items are DONE: run with --done flag to mark complete")
-    print("If NOT done: process them now, then run --done")
-    print()
-    print("eBay links for verification:")
+        append(f"| {i:<3} | {item['item_id']:<15} | {price_display:<14} | {item['type']:<6} |")
+
+    append("+-----+-----------------+----------------+--------+")
+    append('')
+    append("If these items are DONE: run with --done flag to mark complete")
+    append("If NOT done: process them now, then run --done")
+    append('')
+    append("eBay links for verification:")
     for item in pending_items:
-        print(f"  https://www.ebay.com/itm/{item['item_id']}")
-    print()
-    print("=" * 70)
-    print()
+        append(f"  https://www.ebay.com/itm/{item['item_id']}")
+    append('')
+    append(_SEP_EQ70)
+    append('')
+
+    _emit(out)
 
     return True
 
@@ -331,12 +419,14 @@ def show_stats():
         print("No statistics available yet.")
         return
 
+    rows = [row for row in _read_rows(STATS_FILE) if len(row) == 2]
     stats = {}
-    with open(STATS_FILE, 'r', encoding='utf-8') as f:
-        for line in f:
-            if '|' in line:
-                date, cnt = line.strip().split('|')
-                stats[date] = int(cnt)
+    for date, cnt in rows:
+        stats[date] = stats.get(date, 0) + int(cnt)
+
+    # Compact the appended records back into one sorted line per day
+    if len(rows) > len(stats):
+        _write_atomic(STATS_FILE, ''.join(f"{date}|{cnt}\n" for date, cnt in sorted(stats.items())))
 
     if not stats:
         print("No statistics available yet.")
@@ -345,110 +435,123 @@ def show_stats():
     today = datetime.now().strftime('%Y-%m-%d')
     week_ago = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
 
-    # Calculate totals
+    # Calculate totals (ISO dates sort chronologically, so the week is a tail slice)
+    items = sorted(stats.items())
+    week_start = bisect.bisect_left([date for date, _ in items], week_ago)
     total = sum(stats.values())
     today_count = stats.get(today, 0)
-    week_count = sum(cnt for date, cnt in stats.items() if date >= week_ago)
-
-    print()
-    print("=" * 40)
-    print("PROCESSING STATISTICS")
-    print("=" * 40)
-    print(f"  Today:      {today_count} items")
-    print(f"  This week:  {week_count} items")
-    print(f"  All time:   {total} items")
-    print()
-    print("Recent activity:")
-    for date in sorted(stats.keys(), reverse=True)[:7]:
-        print(f"  {date}: {stats[date]} items")
-    print("=" * 40)
+    week_count = sum(cnt for _, cnt in items[week_start:])
+
+    out = []
+    append = out.append
+    append('')
+    append(_SEP_EQ40)
+    append("PROCESSING STATISTICS")
+    append(_SEP_EQ40)
+    append(f"  Today:      {today_count} items")
+    append(f"  This week:  {week_count} items")
+    append(f"  All time:   {total} items")
+    append('')
+    append("Recent activity:")
+    for date, cnt in reversed(items[-7:]):
+        append(f"  {date}: {cnt} items")
+    append(_SEP_EQ40)
+    _emit(out)
+
+
+def _read_pending(path):
+    """Read a pending file into (entry_ids, item_ids); both empty if it is missing."""
+    entry_ids = []
+    item_ids = []
+    for parts in _read_rows(path, missing_ok=True, maxsplit=2):
+        if len(parts) >= 2:
+            entry_ids.append(parts[0])
+            item_ids.append(parts[1])
+    return entry_ids, item_ids
 
 
 def mark_previous_done(reader):
     """Mark previous batch emails as read and log as completed."""
-    total_completed = 0
-
-    # Process price listings pending file
-    if os.path.exists(PENDING_FILE):
-        with open(PENDING_FILE, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-
-        if lines:
-            completed_ids = []
-            marked_count = 0
-            for line in lines:
-                parts = line.strip().split('|')
-                if len(parts) >= 2:
-                    entry_id = parts[0]
-                    item_id = parts[1]
-                    completed_ids.append(item_id)
-                    try:
-                        if reader.mark_as_read(entry_id):
-                            marked_count += 1
-                    except Exception:
-                        pass  # Continue even if marking fails
-
-            # Save to completed file
-            if completed_ids:
-                save_completed(completed_ids)
-                print(f"Saved {len(completed_ids)} price items to completed log")
-                total_completed += len(completed_ids)
-
-            if marked_count:
-                print(f"Marked {marked_count} price emails as read")
-
-        os.remove(PENDING_FILE)
-
-    # Process title-only listings pending file
-    if os.path.exists(TITLE_PENDING_FILE):
-        with open(TITLE_PENDING_FILE, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-
-        if lines:
-            completed_ids = []
-            marked_count = 0
-            for line in lines:
-                parts = line.strip().split('|')
-                if len(parts) >= 2:
-                    entry_id = parts[0]
-                    item_id = parts[1]
-                    completed_ids.append(item_id)
-                    try:
-                        if reader.mark_as_read(entry_id):
-                            marked_count += 1
-                    except Exception:
-                        pass  # Continue even if marking fails
-
-            # Save to completed file
-            if completed_ids:
-                save_completed(completed_ids)
-                print(f"Saved {len(completed_ids)} title-only items to completed log")
-                total_completed += len(completed_ids)
+    completed_ids = []
+    batches = []  # (label, entry_ids, item_ids) per pending file
+    pending_files = ((PENDING_FILE, 'price'), (TITLE_PENDING_FILE, 'title-only'))
+    for path, label in pending_files:
+        pending_entries, pending_items = _read_pending(path)
+        completed_ids += pending_items
+        batches.append((label, pending_entries, pending_items))
+
+    # The log is written before the pending files are consumed, so an interrupted
+    # run can simply be repeated; items the first attempt already logged are
+    # not appended (or counted in the stats) again
+    already_logged = load_completed()
+    new_ids = []
+    saved_counts = []
+    for label, _, pending_items in batches:
+        fresh = [item_id for item_id in pending_items if item_id not in already_logged]
+        already_logged.update(fresh)
+        new_ids += fresh
+        if fresh:
+            saved_counts.append((len(fresh), label))
+
+    # One append (and one stats record) for both files
+    if new_ids:
+        save_completed(new_ids)
+        for count, label in saved_counts:
+            print(f"Saved {count} {label} items to completed log")
+
+    # Consume the files atomically, keeping the last batch as <name>.done
+    for path, _ in pending_files:
+        try:
+            os.replace(path, path + '.done')
+        except FileNotFoundError:
+            pass
 
+    for label, pending_entries, _ in batches:
+        if pending_entries:
+            marked_count = reader.mark_as_read_bulk(pending_entries)
             if marked_count:
-                print(f"Marked {marked_count} title-only emails as read")
-
-        os.remove(TITLE_PENDING_FILE)
-
-    return total_completed
+                print(f"Marked {marked_count} {label} emails as read")
+
+    return len(completed_ids)
+
+
+def _build_listing(email, parsed, body, **extra):
+    """Build a batch listing record from a parsed email plus type-specific fields.
+
+    Derived fields (lowercased body, gallery flag) are computed here once so
+    the display and launch code can reuse them.
+    """
+    body_preview = body[:500]  # Store preview for review
+    listing = {
+        'entry_id': email['entry_id'],
+        'item_id': parsed.item_id,
+        'title': parsed.item_title[:55],
+        'notes': parsed.notes,
+        'notes_display': '; '.join(parsed.notes) if parsed.notes else '',
+        'blue_text': parsed.blue_text,
+        'red_text': parsed.red_text,
+        'body_preview': body_preview,
+        'body_lower': body_preview.lower(),
+        'suspected_new_title': parsed.suspected_new_title,
+    }
+    listing.update(extra)
+    listing['has_gallery'] = has_gallery_photo_instruction(listing)
+    return listing
 
 
 def get_next_batch(reader, limit=5):
     """Get next batch of unread emails, skipping already completed items."""
-    folder = reader.get_folder_by_name(OUTLOOK_CONFIG['folder_name'], OUTLOOK_CONFIG['account_email'])
+    folder = reader.get_folder_by_name(_FOLDER_NAME, _ACCOUNT_EMAIL)
     if not folder:
-        print(f"Folder '{OUTLOOK_CONFIG['folder_name']}' not found")
-        return [], []
+        print(f"Folder '{_FOLDER_NAME}' not found")
+        return [], [], []
 
     # Load already completed items
     completed = load_completed()
     if completed:
         print(f"Skipping {len(completed)} already-completed items")
 
-    # Get more emails than needed since some may be skipped
-    emails = reader.read_emails(folder, limit=limit * 5, unread_only=True)
-
-    parser = EmailParser()
+    parser = _EMAIL_PARSER
     listings = []
     title_only_listings = []  # Emails with eBay URL but no price (title change only)
     instruction_emails = []  # Emails without eBay URLs (instructions from Linda)
@@ -456,73 +559,65 @@ def get_next_batch(reader, limit=5):
     # Track items that have newer unread emails (already completed but Linda sent follow-up)
     follow_up_items = []
 
-    for email in emails:
+    # Look at more emails than needed since some may be skipped. Unread emails
+    # are pulled from Outlook one at a time, so the rest of the folder is never read
+    for email in itertools.islice(reader.iter_unread(folder), limit * 5):
         subject = email.get('subject', '')
+        body = email.get('body', '')
 
         # Skip reply emails (Re:) - these are conversations, not listings
         if subject.lower().startswith('re:'):
             continue
 
+        # Cheap pre-check: without an item URL the parser can only return None
+        if EBAY_ITEM_MARKER not in body and EBAY_ITEM_MARKER not in subject:
+            instruction_emails.append({
+                'subject': subject,
+                'body': body[:300],
+                'entry_id': email['entry_id'],
+            })
+            continue
+
         if len(listings) >= limit:
-            # Still check remaining emails for instruction emails
-            parsed = parser.parse_email(email)
-            if not parsed:
-                # No eBay URL - might be an instruction email
-                instruction_emails.append({
-                    'subject': subject,
-                    'body': email.get('body', '')[:300],
-                    'entry_id': email['entry_id'],
-                })
+            # Batch is full - only instruction emails (caught above) still matter,
+            # so item emails are left for the next batch without a full parse
             continue
 
         parsed = parser.parse_email(email)
-        if parsed and (parsed.new_price is not None or parsed.relist_current_price):
-            # Check if already completed - but detect follow-up emails
-            if parsed.item_id in completed:
-                # This is a NEW unread email for an already-completed item
-                # Linda sent a follow-up with different instructions!
-                follow_up_items.append(parsed.item_id)
-                # Remove from completed so it gets processed
-                completed.discard(parsed.item_id)
-            listings.append({
-                'entry_id': email['entry_id'],
-                'item_id': parsed.item_id,
-                'title': parsed.item_title[:55],
-                'price': parsed.new_price,  # None means use current price
-                'relist_current_price': parsed.relist_current_price,
-                'is_price_revision': parsed.is_price_revision,  # True = REVISE, False = END & RELIST
-                'quantity': parsed.quantity,
-                'notes': parsed.notes,
-                'blue_text': parsed.blue_text,
-                'red_text': parsed.red_text,
-                'needs_review': parsed.needs_review,
-                'body_preview': email.get('body', '')[:500],  # Store preview for review
-                'buyer_username': parsed.buyer_username,
-                'suspected_new_title': parsed.suspected_new_title,
-            })
-        elif parsed and parsed.new_price is None and not parsed.relist_current_price:
-            # Has eBay URL but no price - title/header change only
-            if parsed.item_id in completed:
-                follow_up_items.append(parsed.item_id)
-                completed.discard(parsed.item_id)
-            title_only_listings.append({
-                'entry_id': email['entry_id'],
-                'item_id': parsed.item_id,
-                'title': parsed.item_title[:55],
-                'notes': parsed.notes,
-                'blue_text': parsed.blue_text,
-                'red_text': parsed.red_text,
-                'new_title': parsed.new_title,
-                'body_preview': email.get('body', '')[:500],
-                'suspected_new_title': parsed.suspected_new_title,
-            })
-        elif not parsed:
+        if not parsed:
             # No eBay URL found - might be an instruction email from Linda
             instruction_emails.append({
                 'subject': subject,
-                'body': email.get('body', '')[:300],
+                'body': body[:300],
                 'entry_id': email['entry_id'],
             })
+            continue
+
+        # Check if already completed - but detect follow-up emails
+        if parsed.item_id in completed:
+            # This is a NEW unread email for an already-completed item
+            # Linda sent a follow-up with different instructions!
+            follow_up_items.append(parsed.item_id)
+            # Remove from completed so it gets processed
+            completed.discard(parsed.item_id)
+
+        if parsed.new_price is not None or parsed.relist_current_price:
+            listings.append(_build_listing(
+                email, parsed, body,
+                price=parsed.new_price,  # None means use current price
+                price_str=f"${parsed.new_price:.2f}" if parsed.new_price else "(Current)",
+                relist_current_price=parsed.relist_current_price,
+                is_price_revision=parsed.is_price_revision,  # True = REVISE, False = END & RELIST
+                quantity=parsed.quantity,
+                needs_review=parsed.needs_review,
+                buyer_username=parsed.buyer_username,
+            ))
+        else:
+            # Has eBay URL but no price - title/header change only
+            title_only_listings.append(_build_listing(
+                email, parsed, body,
+                new_title=parsed.new_title,
+            ))
 
     # If we found follow-up emails, update the completed file and notify user
     if follow_up_items:
@@ -536,61 +631,59 @@ def get_next_batch(reader, limit=5):
         remove_from_completed(follow_up_items)
 
     # Save pending entries for next run (price update listings)
-    with open(PENDING_FILE, 'w', encoding='utf-8') as f:
-        for l in listings:
-            price_str = l['price'] if l['price'] is not None else 'CURRENT'
-            f.write(f"{l['entry_id']}|{l['item_id']}|{price_str}\n")
+    _write_atomic(PENDING_FILE, ''.join(
+        f"{l['entry_id']}|{l['item_id']}|{l['price'] if l['price'] is not None else 'CURRENT'}\n"
+        for l in listings))
 
     # Save title-only pending entries (now also tracked by --done)
-    with open(TITLE_PENDING_FILE, 'w', encoding='utf-8') as f:
-        for l in title_only_listings:
-            f.write(f"{l['entry_id']}|{l['item_id']}|TITLE_ONLY\n")
+    _write_atomic(TITLE_PENDING_FILE, ''.join(
+        f"{l['entry_id']}|{l['item_id']}|TITLE_ONLY\n" for l in title_only_listings))
 
     return listings, title_only_listings, instruction_emails
 
 
-def open_pages(listings, buyers_to_block=None):
-    """Open End Listing page and item pages in Chrome."""
-    # First, open the End Your Listing page
-    urls = [END_LISTING_URL]
+def end_relist_urls(listings, buyers_to_block=None):
+    """Build the End Listing, Block Buyer and item page URLs for end & relist items.
 
-    # Open buyer block page if there are buyers to block
-    if buyers_to_block:
-        urls.append(BUYER_BLOCK_URL)
+    Returns (urls, gallery_photo_items).
+    """
+    # First, open the End Your Listing page, then the buyer block page if needed
+    urls = [END_LISTING_URL, *([BUYER_BLOCK_URL] if buyers_to_block else [])]
 
     # Track which items have gallery photo info pages
     gallery_photo_items = []
 
+    # Info pages are independent file writes, so build them concurrently
+    gallery_listings = [l for l in listings if l['has_gallery']]
+    info_paths = {}
+    if gallery_listings:
+        with ThreadPoolExecutor(max_workers=min(8, len(gallery_listings))) as executor:
+            for l, info_path in zip(gallery_listings, executor.map(create_gallery_info_page, gallery_listings)):
+                info_paths[id(l)] = info_path
+
     # Then open each item page (for Sell Similar after ending)
     # For gallery photo items, open an info page BEFORE the item page
     for l in listings:
-        if has_gallery_photo_instruction(l):
-            # Create and add gallery info page before the item page
-            info_path = create_gallery_info_page(l)
+        info_path = info_paths.get(id(l))
+        if info_path:
             urls.append(f"file:///{info_path.replace(os.sep, '/')}")
             gallery_photo_items.append(l['item_id'])
         urls.append(f"https://www.ebay.com/itm/{l['item_id']}")
 
-    cmd = ['start', 'chrome'] + urls
-    subprocess.run(' '.join(cmd), shell=True)
-
-    return gallery_photo_items
+    return urls, list(dict.fromkeys(gallery_photo_items))
 
 
 def handle_instructions(reader):
     """Handle instruction emails (bulk changes like 'change all coin cards to $7.95')."""
-    folder = reader.get_folder_by_name(OUTLOOK_CONFIG['folder_name'], OUTLOOK_CONFIG['account_email'])
+    folder = reader.get_folder_by_name(_FOLDER_NAME, _ACCOUNT_EMAIL)
     if not folder:
-        print(f"Folder '{OUTLOOK_CONFIG['folder_name']}' not found")
+        print(f"Folder '{_FOLDER_NAME}' not found")
         return
 
     # Get unread emails
     emails = reader.read_emails(folder, limit=20, unread_only=True)
 
     # Filter for instruction emails (no eBay URL)
-    import re
-    ebay_url_pattern = r'https?://(?:www\.)?ebay\.com/itm/\d+'
-
     instruction_emails = []
     for email in emails:
         subject = email.get('subject', '')
@@ -601,7 +694,8 @@ def handle_instructions(reader):
             continue
 
         # Check if it has an eBay item URL - if not, it might be an instruction
-        if not re.search(ebay_url_pattern, body):
+        # (the substring test settles most emails without running the regex)
+        if EBAY_ITEM_MARKER not in body or not _EBAY_ITM_RE.search(body):
             instruction_emails.append(email)
 
     if not instruction_emails:
@@ -609,7 +703,7 @@ def handle_instructions(reader):
         return
 
     # Parse each instruction email
-    parser = InstructionParser()
+    parser = _INSTRUCTION_PARSER
     parsed_instructions = []
 
     for email in instruction_emails:
@@ -624,36 +718,39 @@ def handle_instructions(reader):
             })
 
     if not parsed_instructions:
-        print("Found instruction emails but could not parse actionable items.")
-        print("\nRaw instruction emails:")
+        out = ["Found instruction emails but could not parse actionable items.",
+               "\nRaw instruction emails:"]
         for email in instruction_emails:
-            print(f"  Subject: {email.get('subject', 'No subject')}")
-            print(f"  Body: {email.get('body', '')[:200]}...")
-            print()
+            out.append(f"  Subject: {email.get('subject', 'No subject')}")
+            out.append(f"  Body: {email.get('body', '')[:200]}...")
+            out.append('')
+        _emit(out)
         return
 
-    # Display parsed instructions
-    print()
-    print("=" * 70)
-    print("INSTRUCTION EMAILS - PARSED")
-    print("=" * 70)
+    # Display parsed instructions (buffered and written in one go)
+    out = []
+    append = out.append
+    append('')
+    append(_SEP_EQ70)
+    append("INSTRUCTION EMAILS - PARSED")
+    append(_SEP_EQ70)
 
     for i, instr in enumerate(parsed_instructions, 1):
         parsed = instr['parsed']
-        print(f"\n[{i}] {instr['email'].get('subject', 'No subject')}")
-        print(f"    Action: {parsed.action.upper()}")
-        print(f"    Search for: {', '.join(parsed.search_terms)}")
+        append(f"\n[{i}] {instr['email'].get('subject', 'No subject')}")
+        append(f"    Action: {parsed.action.upper()}")
+        append(f"    Search for: {', '.join(parsed.search_terms)}")
         if parsed.new_price:
-            print(f"    New price: ${parsed.new_price:.2f}")
+            append(f"    New price: ${parsed.new_price:.2f}")
         if parsed.item_count:
-            print(f"    Expected items: ~{parsed.item_count}")
+            append(f"    Expected items: ~{parsed.item_count}")
         if parsed.additional_notes:
-            print(f"    Notes: {parsed.additional_notes}")
+            append(f"    Notes: {parsed.additional_notes}")
 
-    print()
-    print("-" * 70)
-    print("Opening Seller Hub searches in Chrome...")
-    print("-" * 70)
+    append('')
+    append(_SEP_DASH70)
+    append("Opening Seller Hub searches in Chrome...")
+    append(_SEP_DASH70)
 
     # Open search URLs
     urls = []
@@ -661,24 +758,24 @@ def handle_instructions(reader):
         for term in instr['parsed'].search_terms:
             url = generate_seller_hub_url(term)
             urls.append(url)
-            print(f"  Search: '{term}'")
-            print(f"  URL: {url}")
-            print()
+            append(f"  Search: '{term}'")
+            append(f"  URL: {url}")
+            append('')
 
     if urls:
-        cmd = ['start', 'chrome'] + urls
-        subprocess.run(' '.join(cmd), shell=True)
+        launch_chrome(urls)
 
-    print("=" * 70)
-    print("NEXT STEPS:")
-    print("  1. Review search results in Chrome")
-    print("  2. Select matching items and bulk edit")
-    print("  3. Once done, mark instruction emails as read in Outlook")
-    print("=" * 70)
+    append(_SEP_EQ70)
+    append("NEXT STEPS:")
+    append("  1. Review search results in Chrome")
+    append("  2. Select matching items and bulk edit")
+    append("  3. Once done, mark instruction emails as read in Outlook")
+    append(_SEP_EQ70)
+    _emit(out)
 
 
-def handle_undo(reader, item_ids):
-    """Handle undo - remove items from completed and mark emails as unread."""
+def handle_undo(item_ids):
+    """Handle undo - remove items from completed so they are processed again."""
     if not item_ids:
         print("Usage: python end_and_relist.py --undo ITEM_ID1 ITEM_ID2 ...")
         return
@@ -697,30 +794,27 @@ def handle_undo(reader, item_ids):
     print("manually mark them as unread in Outlook.")
 
 
-def parse_batch_size(args):
-    """Parse batch size from command line args."""
-    for i, arg in enumerate(args):
-        if arg == '--batch' and i + 1 < len(args):
-            try:
-                return int(args[i + 1])
-            except ValueError:
-                print(f"Invalid batch size: {args[i + 1]}")
-                return None
-    return None
-
-
 def main():
-    # Check for flags
-    test_mode = '--test' in sys.argv
-    mark_done = '--done' in sys.argv
-    instructions_mode = '--instructions' in sys.argv
-    stats_mode = '--stats' in sys.argv
-    undo_mode = '--undo' in sys.argv
-
-    # Parse batch size (default: 5, test mode: 2)
-    custom_batch = parse_batch_size(sys.argv)
-    if custom_batch is not None:
-        batch_size = custom_batch
+    arg_parser = argparse.ArgumentParser(description='End and Relist - process eBay price update emails')
+    arg_parser.add_argument('--done', action='store_true',
+                            help='Mark previous batch complete, then show next batch')
+    arg_parser.add_argument('--test', action='store_true',
+                            help='Test with just 2 items')
+    arg_parser.add_argument('--batch', type=int, default=None,
+                            help='Set custom batch size (default: 5)')
+    arg_parser.add_argument('--instructions', action='store_true',
+                            help='Process instruction emails (bulk changes)')
+    arg_parser.add_argument('--stats', action='store_true',
+                            help='Show processing statistics')
+    arg_parser.add_argument('--undo', nargs='*', default=None, metavar='ITEM_ID',
+                            help='Remove items from completed (for reprocessing)')
+    args = arg_parser.parse_args()
+
+    test_mode = args.test
+
+    # Batch size (default: 5, test mode: 2)
+    if args.batch is not None:
+        batch_size = args.batch
     elif test_mode:
         batch_size = 2
     else:
@@ -730,35 +824,27 @@ def main():
         print("=== TEST MODE: Processing only 2 items ===\n")
 
     # Stats mode doesn't need Outlook
-    if stats_mode:
+    if args.stats:
         show_stats()
         return
 
+    # Undo only edits the completed log, so it doesn't need Outlook either
+    if args.undo is not None:
+        handle_undo(args.undo)
+        return
+
     reader = OutlookReader()
     if not reader.connect():
         print("Failed to connect to Outlook")
         return
 
-    # Handle undo mode
-    if undo_mode:
-        # Get item IDs from args after --undo
-        try:
-            undo_idx = sys.argv.index('--undo')
-            item_ids = sys.argv[undo_idx + 1:]
-            # Filter out other flags
-            item_ids = [x for x in item_ids if not x.startswith('--')]
-        except (ValueError, IndexError):
-            item_ids = []
-        handle_undo(reader, item_ids)
-        return
-
     # Handle instruction emails mode
-    if instructions_mode:
+    if args.instructions:
         handle_instructions(reader)
         return
 
     # Only mark previous batch as done if --done flag is passed
-    if mark_done:
+    if args.done:
         completed_count = mark_previous_done(reader)
         if completed_count:
             print(f"Marked {completed_count} items as completed.\n")
@@ -769,29 +855,41 @@ def main():
     # Get next batch
     listings, title_only_listings, instruction_emails = get_next_batch(reader, limit=batch_size)
 
+    # Batch report is buffered and written in one go at the end
+    out = []
+    append = out.append
+
+    # Every section's tabs go into one Chrome window, opened at the end in display
+    # order. URL -> tab number, so an item forwarded twice shares one tab.
+    chrome_tabs = {}
+
+    def add_tab(url):
+        """Queue a URL (once) and return its Chrome tab number."""
+        return chrome_tabs.setdefault(url, len(chrome_tabs) + 1)
+
     # Always show instruction emails first (important messages from Linda)
     if instruction_emails:
-        print()
-        print("!" * 70)
-        print("ATTENTION: INSTRUCTION EMAILS FROM LINDA")
-        print("!" * 70)
+        append('')
+        append(_SEP_BANG70)
+        append("ATTENTION: INSTRUCTION EMAILS FROM LINDA")
+        append(_SEP_BANG70)
         for instr in instruction_emails:
-            print(f"\nSubject: {instr['subject']}")
-            print(f"Message: {instr['body']}")
-            print("-" * 50)
-        print()
+            append(f"\nSubject: {instr['subject']}")
+            append(f"Message: {instr['body']}")
+            append(_SEP_DASH50)
+        append('')
 
     # Show title-only changes (no price change AND no "List new" - just revise title/description)
     if title_only_listings:
-        print()
-        print("*" * 70)
-        print("TITLE REVISIONS (use REVISE in eBay)")
-        print("*" * 70)
+        append('')
+        append(_SEP_STAR70)
+        append("TITLE REVISIONS (use REVISE in eBay)")
+        append(_SEP_STAR70)
 
         # Determine action for each item
         def get_action(l):
             """Determine the action to display for a title-only listing."""
-            body_lower = l.get('body_preview', '').lower()
+            body_lower = l['body_lower']  # Lowercased once in get_next_batch
             # Check for "remove this listing" type instructions
             if 'remove this listing' in body_lower or 'remove listing' in body_lower:
                 return ("END LISTING", "Remove/end this listing (keep the other one)")
@@ -827,31 +925,18 @@ def main():
             l['action_detail'] = action_detail
 
         # Group by action type and sort: ADD SILVER first (most common), then others
-        action_order = ["ADD SILVER", "NEW TITLE", "END LISTING", "OTHER", "CHECK EMAIL"]
         sorted_listings = sorted(title_only_listings,
-                                  key=lambda x: (action_order.index(x['action_type'])
-                                                if x['action_type'] in action_order else 99))
-
-        # Open Chrome tabs in GROUPED order
-        title_urls = [f"https://www.ebay.com/itm/{l['item_id']}" for l in sorted_listings]
-        cmd = ['start', 'chrome'] + title_urls
-        subprocess.run(' '.join(cmd), shell=True)
+                                  key=lambda x: ACTION_RANK.get(x['action_type'], 99))
 
-        # Build the table data with tab numbers
+        # Build the table data with tab numbers (Chrome tabs open in this GROUPED order)
         table_data = []
-        for tab_num, l in enumerate(sorted_listings, 1):
+        for l in sorted_listings:
             # Determine action text
-            if l['action_type'] == "ADD SILVER":
-                action_text = "Add 'Silver' after 'Sterling'"
-            elif l['action_type'] == "NEW TITLE":
-                action_text = "NEW TITLE: " + l['action_detail'].replace('\n', ' ')
-            elif l['action_type'] == "END LISTING":
-                action_text = "END/REMOVE THIS LISTING"
-            else:
-                action_text = l['action_detail']
+            fmt = ACTION_FMT.get(l['action_type'])
+            action_text = fmt(l) if fmt else l['action_detail']
 
             table_data.append({
-                'tab': tab_num,
+                'tab': add_tab(f"https://www.ebay.com/itm/{l['item_id']}"),
                 'item_id': l['item_id'],
                 'title': l['title'],
                 'action': action_text,
@@ -859,145 +944,147 @@ def main():
             })
 
         # Print compact format - 3 lines per item
-        print()
+        append('')
         for row in table_data:
-            print(f"[{row['tab']}] {row['item_id']} | {row['item_type']}")
-            print(f"    TITLE:  {row['title']}")
-            print(f"    ACTION: {row['action']}")
-            print()
-        print()
-        print(f"Total: {len(sorted_listings)} title revisions | Chrome tabs match table order above")
-        print("These items will be marked complete when you run: --done")
-        print("*" * 70)
-        print()
+            append(f"[{row['tab']}] {row['item_id']} | {row['item_type']}")
+            append(f"    TITLE:  {row['title']}")
+            append(f"    ACTION: {row['action']}")
+            append('')
+        append('')
+        append(f"Total: {len(sorted_listings)} title revisions | Chrome tabs match table order above")
+        append("These items will be marked complete when you run: --done")
+        append(_SEP_STAR70)
+        append('')
 
     if not listings:
         if title_only_listings:
-            print("No price-change listings. Title-only changes shown above.")
-            print("\nWhen done, run: python end_and_relist.py --done")
+            append("No price-change listings. Title-only changes shown above.")
+            append("\nWhen done, run: python end_and_relist.py --done")
         elif instruction_emails:
-            print("No eBay listings to process, but please review the instruction emails above.")
+            append("No eBay listings to process, but please review the instruction emails above.")
         else:
-            print("No more unread emails with eBay price updates!")
+            append("No more unread emails with eBay price updates!")
+        if chrome_tabs:
+            launch_chrome(list(chrome_tabs), new_window=True)
+        _emit(out)
         return
 
-    # Check for buyers to block
+    # One pass: find buyers to block and split listings into REVISE (price
+    # changes) and END & RELIST
     buyers_to_block = []
+    price_revisions = []
+    end_relist_items = []
     for l in listings:
-        notes_text = ' '.join(l.get('notes', []) or []).lower()
-        title_text = l.get('title', '').lower()
-        if 'block' in notes_text or 'block' in title_text:
-            if l.get('buyer_username'):
+        # Only listings with a buyer can need blocking, so scan text for those alone
+        buyer_username = l.get('buyer_username')
+        if buyer_username:
+            search = _BLOCK_WORD_RE.search
+            if any(map(search, l.get('notes') or ())) or search(l.get('title') or ''):
                 buyers_to_block.append({
-                    'username': l['buyer_username'],
+                    'username': buyer_username,
                     'item_id': l['item_id'],
                     'title': l['title']
                 })
+        (price_revisions if l.get('is_price_revision') else end_relist_items).append(l)
 
     # Display buyers to block first (important!)
     if buyers_to_block:
-        print()
-        print("!" * 70)
-        print("BUYERS TO BLOCK (copy username to Block Buyer page):")
-        print("!" * 70)
+        append('')
+        append(_SEP_BANG70)
+        append("BUYERS TO BLOCK (copy username to Block Buyer page):")
+        append(_SEP_BANG70)
         for b in buyers_to_block:
-            print(f"\n  Username: {b['username']}")
-            print(f"  Item: {b['item_id']} - {b['title'][:40]}")
-        print()
-        print("!" * 70)
-        print()
-
-    # Split listings into REVISE (price changes) and END & RELIST
-    price_revisions = [l for l in listings if l.get('is_price_revision')]
-    end_relist_items = [l for l in listings if not l.get('is_price_revision')]
+            append(f"\n  Username: {b['username']}")
+            append(f"  Item: {b['item_id']} - {b['title'][:40]}")
+        append('')
+        append(_SEP_BANG70)
+        append('')
 
     # ===== PRICE REVISIONS (just change the price) =====
     if price_revisions:
-        print()
-        print("#" * 60)
-        print("PRICE REVISIONS (just REVISE the price - do NOT end listing)")
-        print("#" * 60)
-        print()
-
-        # Open just the item pages for revision
-        revision_urls = [f"https://www.ebay.com/itm/{l['item_id']}" for l in price_revisions]
-        cmd = ['start', 'chrome'] + revision_urls
-        subprocess.run(' '.join(cmd), shell=True)
+        append('')
+        append(_SEP_HASH60)
+        append("PRICE REVISIONS (just REVISE the price - do NOT end listing)")
+        append(_SEP_HASH60)
+        append('')
 
         for i, l in enumerate(price_revisions, 1):
-            price_str = f"${l['price']:.2f}" if l['price'] else "(Current)"
-            print(f"[{i}] {l['item_id']} | NEW PRICE: {price_str} | REVISE")
-            print(f"    TITLE:  {l['title']}")
+            # Just the item page for revision
+            add_tab(f"https://www.ebay.com/itm/{l['item_id']}")
+            append(f"[{i}] {l['item_id']} | NEW PRICE: {l['price_str']} | REVISE")
+            append(f"    TITLE:  {l['title']}")
             action_parts = []
-            if l.get('notes'):
-                action_parts.append('; '.join(l['notes']))
+            if l['notes_display']:
+                action_parts.append(l['notes_display'])
             if l.get('new_title'):
                 action_parts.append(f"NEW TITLE: {l['new_title']}")
             if l.get('blue_text'):
                 for bt in l['blue_text']:
                     action_parts.append(f"USE TITLE: {bt}")
             if action_parts:
-                print(f"    ACTION: {'; '.join(action_parts)}")
+                append(f"    ACTION: {'; '.join(action_parts)}")
             # Show suspected title if Linda forgot blue text
             if l.get('suspected_new_title') and not l.get('blue_text') and not l.get('new_title'):
-                print(f"    *** SUSPECTED TITLE (not blue): {l['suspected_new_title']}")
-            print()
+                append(f"    *** SUSPECTED TITLE (not blue): {l['suspected_new_title']}")
+            append('')
 
-        print(f"Opened {len(price_revisions)} tabs - REVISE price only (do NOT end)")
-        print()
+        append(f"Opened {len(price_revisions)} tabs - REVISE price only (do NOT end)")
+        append('')
 
     # ===== END & RELIST ITEMS =====
     if end_relist_items:
-        print()
-        print("#" * 60)
-        print("END & RELIST ITEMS (End listing, then 'Sell Similar')")
-        print("#" * 60)
-        print()
+        append('')
+        append(_SEP_HASH60)
+        append("END & RELIST ITEMS (End listing, then 'Sell Similar')")
+        append(_SEP_HASH60)
+        append('')
 
         # Item numbers to copy
-        print("ITEM NUMBERS TO COPY TO 'END YOUR LISTING' PAGE:")
-        print("+" + "-"*16 + "+")
+        append("ITEM NUMBERS TO COPY TO 'END YOUR LISTING' PAGE:")
+        append(_SEP_BOX16)
         for l in end_relist_items:
-            print(f"| {l['item_id']:<14} |")
-        print("+" + "-"*16 + "+")
-        print()
+            append(f"| {l['item_id']:<14} |")
+        append(_SEP_BOX16)
+        append('')
 
         for i, l in enumerate(end_relist_items, 1):
-            price_str = f"${l['price']:.2f}" if l['price'] else "(Current)"
-            print(f"[{i}] {l['item_id']} | NEW PRICE: {price_str} | LIST NEW")
-            print(f"    TITLE:  {l['title']}")
+            append(f"[{i}] {l['item_id']} | NEW PRICE: {l['price_str']} | LIST NEW")
+            append(f"    TITLE:  {l['title']}")
             action_parts = []
-            if l.get('notes'):
-                action_parts.append('; '.join(l['notes']))
+            if l['notes_display']:
+                action_parts.append(l['notes_display'])
             if l.get('buyer_username'):
                 action_parts.append(f"BLOCK: {l['buyer_username']}")
             if l.get('blue_text'):
                 for bt in l['blue_text']:
                     action_parts.append(f"USE TITLE: {bt}")
             if action_parts:
-                print(f"    ACTION: {'; '.join(action_parts)}")
+                append(f"    ACTION: {'; '.join(action_parts)}")
             # Show suspected title if Linda forgot blue text
             if l.get('suspected_new_title') and not l.get('blue_text'):
-                print(f"    *** SUSPECTED TITLE (not blue): {l['suspected_new_title']}")
-            print()
+                append(f"    *** SUSPECTED TITLE (not blue): {l['suspected_new_title']}")
+            append('')
 
-        # Open pages for end & relist
-        gallery_photo_items = open_pages(end_relist_items, buyers_to_block)
+        # Pages for end & relist follow any title/price revision tabs
+        urls, gallery_photo_items = end_relist_urls(end_relist_items, buyers_to_block)
+        tab_nums = [add_tab(url) for url in urls]
 
-        print("Opened in Chrome:")
-        print("  - Tab 1: End Your Listing page")
-        tab_num = 2
+        append("Opened in Chrome:")
+        append(f"  - Tab {tab_nums[0]}: End Your Listing page")
+        tab_num = tab_nums[1]
         if buyers_to_block:
-            print(f"  - Tab {tab_num}: Buyer Block page")
-            tab_num += 1
+            append(f"  - Tab {tab_num}: Buyer Block page")
+            tab_num = tab_nums[2]
         if gallery_photo_items:
-            print(f"  - Gallery photo info pages opened BEFORE these items: {', '.join(gallery_photo_items)}")
-            print(f"  - Tabs {tab_num}+: Item pages with gallery info tabs preceding them")
+            append(f"  - Gallery photo info pages opened BEFORE these items: {', '.join(gallery_photo_items)}")
+            append(f"  - Tabs {tab_num}+: Item pages with gallery info tabs preceding them")
         else:
-            print(f"  - Tabs {tab_num}+: Item pages (click 'Sell Similar' after ending)")
+            append(f"  - Tabs {tab_num}+: Item pages (click 'Sell Similar' after ending)")
 
-    print()
-    print("When done, run: python end_and_relist.py --done")
+    append('')
+    append("When done, run: python end_and_relist.py --done")
+    launch_chrome(list(chrome_tabs), new_window=True)
+    _emit(out)
 
 
 if __name__ == "__main__":
@@ -12,7 +12,9 @@ Usage:
     python extract_knowledge.py                    # Process all unprocessed transcripts
     python extract_knowledge.py --video aQvpqlSiUIQ  # Process specific video
     python extract_knowledge.py --force            # Reprocess all transcripts
+    python extract_knowledge.py --force --no-cache # Reprocess without reusing cached responses
     python extract_knowledge.py --dry-run          # Show what would be extracted
+    python extract_knowledge.py --batch            # Process all at half price via the Batches API
     python extract_knowledge.py stats              # Show extraction statistics
     python extract_knowledge.py export             # Export all extracted knowledge
 """
@@ -22,21 +24,41 @@ import sys
 import json
 import re
 import argparse
-from datetime import datetime
+import atexit
+import bisect
+import difflib
+import functools
+import hashlib
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
 
+from tool_patterns import extract_tools
+
 try:
     import anthropic
     HAS_ANTHROPIC = True
 except ImportError:
     HAS_ANTHROPIC = False
 
-# Paths
-KNOWLEDGE_BASE = Path(r"D:\AI-Knowledge-Base")
+# Optional: faster JSON for the master DB and extraction files; stdlib json is used otherwise
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Paths (KB_DIR overrides the knowledge base location)
+KNOWLEDGE_BASE = Path(os.environ.get('KB_DIR', r"D:\AI-Knowledge-Base"))
 MASTER_DB = KNOWLEDGE_BASE / "master_db.json"
 TRANSCRIPTS_DIR = KNOWLEDGE_BASE / "tutorials" / "transcripts"
 EXTRACTED_DIR = KNOWLEDGE_BASE / "extracted"
 TOKEN_USAGE_FILE = KNOWLEDGE_BASE / "token_usage.json"
+LLM_CACHE_DIR = KNOWLEDGE_BASE / "llm_cache"  # Claude responses by request hash
+PENDING_BATCHES_FILE = KNOWLEDGE_BASE / "pending_batches.json"  # --batch jobs not yet collected
+LLM_CACHE_DAYS = 7  # Re-ask Claude for chunks cached longer ago than this
 
 # Session token tracking
 SESSION_TOKENS = {
@@ -45,24 +67,49 @@ SESSION_TOKENS = {
     'total': 0,
     'api_calls': 0
 }
+_usage = None  # All-time usage: loaded on first API call, written by finalize_session()
+_usage_lock = threading.Lock()  # Chunks finish on worker threads
 
 # Extraction settings
-CHUNK_SIZE = 3000  # Characters per chunk (roughly 750 tokens)
-CHUNK_OVERLAP = 200  # Overlap between chunks for context
-
-# Extraction prompt template
-EXTRACTION_PROMPT = """Analyze this transcript segment from an AI tutorial video and extract structured knowledge.
-
-VIDEO: {video_title}
-CHANNEL: {channel}
-SEGMENT: {segment_num} of {total_segments}
-
-TRANSCRIPT:
-{transcript_chunk}
-
----
-
-Extract the following in JSON format:
+# Chunks are sized in tokens, converted with the usual ~4 characters per English token
+CHARS_PER_TOKEN = 4
+MAX_INPUT_TOKENS = 2000  # Transcript tokens per chunk (the prompt template adds ~900)
+OVERLAP_TOKENS = 128  # Overlap between chunks for context
+CHUNK_SIZE = MAX_INPUT_TOKENS * CHARS_PER_TOKEN  # Characters per chunk
+CHUNK_OVERLAP = OVERLAP_TOKENS * CHARS_PER_TOKEN
+MIN_CHUNK_WORDS = 150  # Shorter chunks (usually just the overlap at the end) join the one before
+MIN_UNIQUE_WORD_RATIO = 0.15  # Chunks more repetitive than this ("[Music] [Music] ...") are skipped
+CHUNK_WORKERS = 4  # Chunks of one video sent to the API at the same time
+VIDEO_WORKERS = 3  # Videos extracted at the same time
+MAX_INFLIGHT = 8  # API requests in flight at once, across all videos
+
+# Claude API settings
+CLAUDE_MODEL = "claude-sonnet-4-20250514"
+BATCH_POLL_SECONDS = 60  # How often --batch checks whether its batch has finished
+BATCH_MAX_REQUESTS = 100_000  # Message Batches API limits for a single batch
+BATCH_MAX_BYTES = 256 * 1024 * 1024
+API_RETRIES = 5  # The client retries rate limits (429) and overloads with backoff
+
+# Item lists that aggregate, export and stats cover (tools_mentioned stays per video)
+KNOWLEDGE_KINDS = ('tips', 'workflows', 'prompts', 'insights')
+
+# Field that identifies each kind of item when merging chunks
+MERGE_KEYS = {'tips': 'text', 'workflows': 'name', 'prompts': 'text', 'insights': 'text'}
+DUPLICATE_SIMILARITY = 0.85  # difflib ratio at which two items count as the same
+# Short names like "Setup Project A" / "Setup Project B" are near-identical yet distinct,
+# so these only merge on an exact (normalized) match
+EXACT_MATCH_KINDS = {'workflows'}
+WORD_PATTERN = re.compile(r'[a-z0-9]+')
+
+# process_all_transcripts saves the master DB after this many videos
+CHECKPOINT_EVERY = 10
+
+EXTRACTION_RETRIES = 2  # Extra attempts when a response doesn't match the schema
+
+# Extraction instructions - the same for every chunk, so they go in the system prompt
+EXTRACTION_INSTRUCTIONS = """Analyze the transcript segment from an AI tutorial video in the user message and extract structured knowledge.
+
+Extract the following:
 
 1. **tips**: Actionable tips and best practices mentioned. Each tip should be:
    - Clear and actionable (something someone can do)
@@ -80,52 +127,104 @@ Extract the following in JSON format:
 
 4. **insights**: Key insights or non-obvious observations about AI tools/techniques.
 
-5. **tools_mentioned**: Specific tools, services, or technologies mentioned with context.
-
-Respond ONLY with valid JSON in this exact format:
-{{
+Record them with the record_knowledge tool, in this format:
+{
   "tips": [
-    {{
+    {
       "text": "Always create a CLAUDE.md file at the root of your project",
       "category": "project-setup",
       "timestamp_approx": "03:45"
-    }}
+    }
   ],
   "workflows": [
-    {{
+    {
       "name": "Claude Code Project Setup",
       "steps": ["Step 1", "Step 2", "Step 3"],
       "prerequisites": ["Have Claude Code installed"]
-    }}
+    }
   ],
   "prompts": [
-    {{
+    {
       "text": "You are a senior software architect...",
       "purpose": "Code review prompt"
-    }}
+    }
   ],
   "insights": [
-    {{
+    {
       "text": "Plan mode reduces token usage by 40%",
       "topic": "optimization"
-    }}
-  ],
-  "tools_mentioned": [
-    {{
-      "name": "Claude Code",
-      "context": "Main tool for AI-assisted coding"
-    }}
+    }
   ]
-}}
+}
+
+If a category has no items, use an empty array []."""
 
-If a category has no items, use an empty array []. Ensure valid JSON output."""
+# The part of the prompt that changes per chunk
+SEGMENT_PROMPT = """VIDEO: {video_title}
+CHANNEL: {channel}
+SEGMENT: {segment_num} of {total_segments}
+
+TRANSCRIPT:
+{transcript_chunk}"""
+
+# Schema of the record_knowledge tool - forcing the model to call it guarantees parseable JSON
+EXTRACTION_TOOL = {
+    'name': 'record_knowledge',
+    'description': 'Record the knowledge extracted from a transcript segment.',
+    'input_schema': {
+        'type': 'object',
+        'properties': {
+            'tips': {'type': 'array', 'items': {
+                'type': 'object',
+                'properties': {'text': {'type': 'string'}, 'category': {'type': 'string'},
+                               'timestamp_approx': {'type': 'string'}},
+                'required': ['text']}},
+            'workflows': {'type': 'array', 'items': {
+                'type': 'object',
+                'properties': {'name': {'type': 'string'},
+                               'steps': {'type': 'array', 'items': {'type': 'string'}},
+                               'prerequisites': {'type': 'array', 'items': {'type': 'string'}}},
+                'required': ['name', 'steps']}},
+            'prompts': {'type': 'array', 'items': {
+                'type': 'object',
+                'properties': {'text': {'type': 'string'}, 'purpose': {'type': 'string'}},
+                'required': ['text']}},
+            'insights': {'type': 'array', 'items': {
+                'type': 'object',
+                'properties': {'text': {'type': 'string'}, 'topic': {'type': 'string'}},
+                'required': ['text']}},
+        },
+        'required': ['tips', 'workflows', 'prompts', 'insights']
+    }
+}
+
+
+def read_json(path):
+    """Read a JSON file (orjson if available)."""
+    if HAS_ORJSON:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_json(path, data):
+    """
+    Write a JSON file, 2-space indented UTF-8 (orjson if available).
+    Written to a temp file and swapped in, so a crash never leaves a half-written file.
+    """
+    temp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    if HAS_ORJSON:
+        temp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(temp_path, path)
 
 
 def load_token_usage():
     """Load token usage statistics."""
     if TOKEN_USAGE_FILE.exists():
-        with open(TOKEN_USAGE_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return read_json(TOKEN_USAGE_FILE)
     return {
         'total_input_tokens': 0,
         'total_output_tokens': 0,
@@ -140,41 +239,45 @@ def load_token_usage():
 def save_token_usage(usage_data):
     """Save token usage statistics."""
     TOKEN_USAGE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(TOKEN_USAGE_FILE, 'w', encoding='utf-8') as f:
-        json.dump(usage_data, f, indent=2)
+    write_json(TOKEN_USAGE_FILE, usage_data)
 
 
 def record_token_usage(input_tokens, output_tokens):
-    """Record token usage for session and all-time tracking."""
-    global SESSION_TOKENS
-
-    # Update session counters
-    SESSION_TOKENS['input'] += input_tokens
-    SESSION_TOKENS['output'] += output_tokens
-    SESSION_TOKENS['total'] += input_tokens + output_tokens
-    SESSION_TOKENS['api_calls'] += 1
-
-    # Update all-time counters
-    usage = load_token_usage()
-    usage['total_input_tokens'] += input_tokens
-    usage['total_output_tokens'] += output_tokens
-    usage['total_tokens'] += input_tokens + output_tokens
-    usage['total_api_calls'] += 1
-
-    now = datetime.now().isoformat()
-    if not usage['first_use']:
-        usage['first_use'] = now
-    usage['last_use'] = now
-
-    save_token_usage(usage)
+    """Record token usage for session and all-time tracking (in memory until finalize_session)."""
+    global SESSION_TOKENS, _usage
+    total_tokens = input_tokens + output_tokens
+
+    with _usage_lock:
+        # Update session counters
+        SESSION_TOKENS['input'] += input_tokens
+        SESSION_TOKENS['output'] += output_tokens
+        SESSION_TOKENS['total'] += total_tokens
+        SESSION_TOKENS['api_calls'] += 1
+
+        # Update all-time counters
+        if _usage is None:
+            _usage = load_token_usage()
+        usage = _usage
+        usage['total_input_tokens'] += input_tokens
+        usage['total_output_tokens'] += output_tokens
+        usage['total_tokens'] += total_tokens
+        usage['total_api_calls'] += 1
+
+        now = datetime.now().isoformat()
+        if not usage['first_use']:
+            usage['first_use'] = now
+        usage['last_use'] = now
 
 
 def finalize_session():
-    """Record session summary to token usage file."""
-    if SESSION_TOKENS['api_calls'] == 0:
-        return
+    """Record session summary and write the token usage file."""
+    global _usage
+
+    with _usage_lock:
+        usage, _usage = _usage, None
+    if usage is None:
+        return  # No API calls since the last save
 
-    usage = load_token_usage()
     usage['sessions'].append({
         'date': datetime.now().isoformat(),
         'input_tokens': SESSION_TOKENS['input'],
@@ -188,19 +291,21 @@ def finalize_session():
     save_token_usage(usage)
 
 
+# Token usage is only written at the end of a run - make sure an interrupted run still saves it
+atexit.register(finalize_session)
+
+
 def load_database():
     """Load the master database."""
     if not MASTER_DB.exists():
         return {}
-    with open(MASTER_DB, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return read_json(MASTER_DB)
 
 
 def save_database(db):
     """Save the master database."""
     db['metadata']['last_updated'] = datetime.now().strftime('%Y-%m-%d')
-    with open(MASTER_DB, 'w', encoding='utf-8') as f:
-        json.dump(db, f, indent=2)
+    write_json(MASTER_DB, db)
 
 
 def chunk_transcript(text, chunk_size=CHUNK_SIZE, overlap=CHUNK_OVERLAP):
@@ -230,11 +335,61 @@ def chunk_transcript(text, chunk_size=CHUNK_SIZE, overlap=CHUNK_OVERLAP):
     return chunks
 
 
+def strip_overlap(previous, chunk, overlap=CHUNK_OVERLAP):
+    """Drop the start of chunk that repeats the end of previous (at most overlap characters)."""
+    for size in range(min(overlap, len(previous), len(chunk)), 0, -1):
+        if previous.endswith(chunk[:size]):
+            return chunk[size:]
+    return chunk
+
+
+def drop_low_signal_chunks(chunks):
+    """
+    Avoid paying for chunks that can't yield much: tiny chunks are appended to the
+    previous one and highly repetitive ones are dropped.
+    Returns (chunks, merged count, skipped count).
+    """
+    kept = []
+    merged = 0
+    skipped = 0
+
+    for chunk in chunks:
+        words = chunk.lower().split()
+        if len(set(words)) < MIN_UNIQUE_WORD_RATIO * len(words):
+            skipped += 1
+        elif len(words) < MIN_CHUNK_WORDS and kept:
+            # Most of a short trailing chunk is the overlap the previous one already has
+            rest = strip_overlap(kept[-1], chunk).strip()
+            if rest:
+                kept[-1] += ' ' + rest
+            merged += 1
+        else:
+            kept.append(chunk)
+
+    return kept, merged, skipped
+
+
 API_KEY = None  # Global API key storage
+USE_CACHE = True  # Turned off with --no-cache
+
+# One client for the whole run, so every call reuses its keep-alive connections
+_client = None
+_client_lock = threading.Lock()
+_api_slots = threading.BoundedSemaphore(MAX_INFLIGHT)
+_stop_requested = threading.Event()  # Set on Ctrl+C so queued chunks skip the API
+
+def set_concurrency(max_inflight):
+    """Allow max_inflight API requests at once, with enough video workers to keep them busy."""
+    global MAX_INFLIGHT, VIDEO_WORKERS, _api_slots
+
+    MAX_INFLIGHT = max_inflight
+    VIDEO_WORKERS = max(1, -(-max_inflight // CHUNK_WORKERS))  # Rounded up
+    _api_slots = threading.BoundedSemaphore(max_inflight)
 
-def extract_with_claude(chunk, video_title, channel, segment_num, total_segments):
-    """Use Claude API to extract knowledge from a chunk."""
-    global API_KEY
+
+def get_client():
+    """Return the shared Claude API client, or print why there is none and return None."""
+    global API_KEY, _client
 
     if not HAS_ANTHROPIC:
         print("ERROR: anthropic package not installed. Run: pip install anthropic")
@@ -246,9 +401,15 @@ def extract_with_claude(chunk, video_title, channel, segment_num, total_segments
         print("ERROR: ANTHROPIC_API_KEY not set. Use --api-key or set environment variable")
         return None
 
-    client = anthropic.Anthropic(api_key=api_key)
+    with _client_lock:
+        if _client is None:
+            _client = anthropic.Anthropic(api_key=api_key, max_retries=API_RETRIES)
+    return _client
+
 
-    prompt = EXTRACTION_PROMPT.format(
+def build_request(chunk, video_title, channel, segment_num, total_segments):
+    """Build the Messages API parameters for one transcript chunk."""
+    prompt = SEGMENT_PROMPT.format(
         video_title=video_title,
         channel=channel,
         segment_num=segment_num,
@@ -256,101 +417,213 @@ def extract_with_claude(chunk, video_title, channel, segment_num, total_segments
         transcript_chunk=chunk
     )
 
+    return {
+        'model': CLAUDE_MODEL,
+        'max_tokens': 2000,
+        'tools': [EXTRACTION_TOOL],
+        'tool_choice': {'type': 'tool', 'name': EXTRACTION_TOOL['name']},
+        'system': EXTRACTION_INSTRUCTIONS,
+        'messages': [
+            {"role": "user", "content": prompt}
+        ]
+    }
+
+
+def parse_extraction(message):
+    """Record a response's token usage and return the record_knowledge tool input from it."""
+    # Record token usage
+    record_token_usage(message.usage.input_tokens, message.usage.output_tokens)
+
+    # The API has already parsed the tool call's JSON
+    extraction = next((block.input for block in message.content if block.type == 'tool_use'), None)
+    if extraction is None:
+        print(f"  Warning: No record_knowledge call in response (stopped: {message.stop_reason})")
+        return None
+
+    missing = [key for key in EXTRACTION_TOOL['input_schema']['required']
+               if not isinstance(extraction.get(key), list)]
+    if missing:
+        print(f"  Warning: Response is missing {', '.join(missing)} (stopped: {message.stop_reason})")
+        return None
+
+    return extraction
+
+
+def cache_path(params):
+    """Cache file for a request, named by a hash of its model, settings and full prompt."""
+    key = hashlib.sha256(json.dumps(params, sort_keys=True).encode('utf-8')).hexdigest()
+    return LLM_CACHE_DIR / key[:2] / f"{key}.json"
+
+
+def load_cached_extraction(params):
+    """Return the extraction saved for an identical earlier request, or None."""
+    if not USE_CACHE:
+        return None
+
+    path = cache_path(params)
     try:
-        message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=2000,
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
-
-        # Record token usage
-        input_tokens = message.usage.input_tokens
-        output_tokens = message.usage.output_tokens
-        record_token_usage(input_tokens, output_tokens)
-
-        response_text = message.content[0].text
-
-        # Parse JSON from response
-        # Try to find JSON in response
-        json_match = re.search(r'\{[\s\S]*\}', response_text)
-        if json_match:
-            return json.loads(json_match.group())
-        else:
-            print(f"  Warning: Could not parse JSON from response")
-            return None
+        cached = read_json(path)
+        age = datetime.now() - datetime.fromisoformat(cached['cached_at'])
+        result = cached['result']
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError):
+        # Truncated, corrupt or locked entry - a miss, never a reason to stop the run
+        discard_cached_extraction(path)
+        return None
+    if age > timedelta(days=LLM_CACHE_DAYS):
+        discard_cached_extraction(path)  # Stale - the fresh response is saved in its place
+        return None
+    return result
+
+
+def migrate_flat_cache():
+    """Move cache entries saved before the cache was split into subfolders into their subfolder."""
+    try:
+        with os.scandir(LLM_CACHE_DIR) as entries:
+            flat_files = [entry.name for entry in entries if entry.is_file() and entry.name.endswith('.json')]
+    except FileNotFoundError:
+        return
+
+    for name in flat_files:
+        try:
+            (LLM_CACHE_DIR / name[:2]).mkdir(exist_ok=True)
+            os.replace(LLM_CACHE_DIR / name, LLM_CACHE_DIR / name[:2] / name)
+        except OSError:
+            pass  # Locked - moved on a later run
+
+
+def discard_cached_extraction(path):
+    """Delete a cache entry that can't be used, if the file system allows it."""
+    try:
+        path.unlink(missing_ok=True)
+    except OSError:
+        pass  # Still locked - the next save overwrites it
+
+
+def save_cached_extraction(params, result):
+    """Save a successful extraction so the same chunk is never paid for twice."""
+    if not USE_CACHE or not result:
+        return
+
+    path = cache_path(params)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_json(path, {
+        'model': params['model'],
+        'cached_at': datetime.now().isoformat(),
+        'result': result
+    })
 
-    except json.JSONDecodeError as e:
-        print(f"  Warning: JSON parse error: {e}")
+
+def extract_with_claude(chunk, video_title, channel, segment_num, total_segments):
+    """Use Claude API to extract knowledge from a chunk."""
+    params = build_request(chunk, video_title, channel, segment_num, total_segments)
+    cached = load_cached_extraction(params)
+    if cached is not None:
+        return cached
+
+    client = get_client()
+    if not client:
         return None
+
+    try:
+        # Truncated or malformed tool calls are rare; ask again before giving up on the chunk
+        for attempt in range(EXTRACTION_RETRIES + 1):
+            with _api_slots:
+                # Checked once a slot is free, so chunks that waited out the interrupt don't send
+                if _stop_requested.is_set():
+                    return None
+                message = client.messages.create(**params)
+            result = parse_extraction(message)
+            if result is not None:
+                break
+            if attempt < EXTRACTION_RETRIES:
+                time.sleep(1.0 * (attempt + 1))
+        save_cached_extraction(params, result)
+        return result
+
     except Exception as e:
         print(f"  Error calling Claude API: {e}")
         return None
 
 
+def normalize_text(text):
+    """Lowercase words only, so wording matches regardless of punctuation and spacing."""
+    return ' '.join(WORD_PATTERN.findall(text.lower()))
+
+
+def is_near_duplicate(key, seen_keys):
+    """True if the normalized text closely matches one already kept."""
+    matcher = difflib.SequenceMatcher(None, b=key)
+    for other in seen_keys:
+        matcher.set_seq1(other)
+        # Cheap upper bounds first; the full ratio only for likely matches
+        if (matcher.real_quick_ratio() >= DUPLICATE_SIMILARITY
+                and matcher.quick_ratio() >= DUPLICATE_SIMILARITY
+                and matcher.ratio() >= DUPLICATE_SIMILARITY):
+            return True
+    return False
+
+
+def find_tools_mentioned(merged):
+    """
+    List the known tools named in a video's merged tips and insights, most mentioned first.
+    Each tool gets the first item that names it as context.
+    """
+    texts = [item.get('text') or '' for kind in ('tips', 'insights') for item in merged[kind]]
+    tools_by_text = [(text, extract_tools(text)) for text in texts]
+
+    tools = []
+    for name in extract_tools('\n'.join(texts)):  # Patterns never span a newline
+        context = next((text for text, found in tools_by_text if name in found), '')
+        tools.append({'name': name, 'context': context})
+    return tools
+
+
 def merge_extractions(extractions):
     """Merge and deduplicate extractions from multiple chunks."""
-    merged = {
-        'tips': [],
-        'workflows': [],
-        'prompts': [],
-        'insights': [],
-        'tools_mentioned': []
-    }
-
-    seen_tips = set()
-    seen_workflows = set()
-    seen_prompts = set()
-    seen_insights = set()
-    seen_tools = set()
+    merged = {kind: [] for kind in MERGE_KEYS}
+    seen = {kind: set() for kind in MERGE_KEYS}
 
     for extraction in extractions:
         if not extraction:
             continue
 
-        # Merge tips (dedupe by text similarity)
-        for tip in extraction.get('tips', []):
-            tip_key = tip.get('text', '')[:50].lower()
-            if tip_key and tip_key not in seen_tips:
-                seen_tips.add(tip_key)
-                merged['tips'].append(tip)
-
-        # Merge workflows (dedupe by name)
-        for workflow in extraction.get('workflows', []):
-            wf_key = workflow.get('name', '').lower()
-            if wf_key and wf_key not in seen_workflows:
-                seen_workflows.add(wf_key)
-                merged['workflows'].append(workflow)
-
-        # Merge prompts (dedupe by text start)
-        for prompt in extraction.get('prompts', []):
-            prompt_key = prompt.get('text', '')[:50].lower()
-            if prompt_key and prompt_key not in seen_prompts:
-                seen_prompts.add(prompt_key)
-                merged['prompts'].append(prompt)
-
-        # Merge insights
-        for insight in extraction.get('insights', []):
-            insight_key = insight.get('text', '')[:50].lower()
-            if insight_key and insight_key not in seen_insights:
-                seen_insights.add(insight_key)
-                merged['insights'].append(insight)
-
-        # Merge tools
-        for tool in extraction.get('tools_mentioned', []):
-            tool_key = tool.get('name', '').lower()
-            if tool_key and tool_key not in seen_tools:
-                seen_tools.add(tool_key)
-                merged['tools_mentioned'].append(tool)
+        for kind, field in MERGE_KEYS.items():
+            for item in extraction.get(kind, []):
+                key = normalize_text(item.get(field) or '')
+                if not key or key in seen[kind]:
+                    continue
+                if kind not in EXACT_MATCH_KINDS and is_near_duplicate(key, seen[kind]):
+                    continue
+                seen[kind].add(key)
+                merged[kind].append(item)
 
     return merged
 
 
-def process_transcript(video_id, force=False, dry_run=False):
-    """Process a single transcript and extract knowledge."""
-    db = load_database()
+@functools.lru_cache(maxsize=None)
+def transcript_file_names():
+    """Sorted names in TRANSCRIPTS_DIR, scanned once per run (this script never writes there)."""
+    if not TRANSCRIPTS_DIR.is_dir():
+        return []
+    with os.scandir(TRANSCRIPTS_DIR) as entries:
+        return sorted(entry.name for entry in entries if entry.is_file())
 
+
+def find_transcript_file(video_id):
+    """Return the transcript file for a video ({video_id}*.txt), or None."""
+    names = transcript_file_names()
+    i = bisect.bisect_left(names, video_id)
+    while i < len(names) and names[i].startswith(video_id):
+        if names[i].endswith('.txt'):
+            return TRANSCRIPTS_DIR / names[i]
+        i += 1
+    return None
+
+
+def prepare_transcript(db, video_id, force=False):
+    """Find a video and its transcript. Returns (video_info, chunks) or None."""
     # Find video in database
     video_info = None
     for tutorial in db.get('tutorials', []):
@@ -368,10 +641,7 @@ def process_transcript(video_id, force=False, dry_run=False):
         return None
 
     # Find transcript file
-    transcript_file = None
-    for f in TRANSCRIPTS_DIR.glob(f"{video_id}*.txt"):
-        transcript_file = f
-        break
+    transcript_file = find_transcript_file(video_id)
 
     if not transcript_file:
         print(f"Transcript not found for {video_id}")
@@ -381,58 +651,40 @@ def process_transcript(video_id, force=False, dry_run=False):
     with open(transcript_file, 'r', encoding='utf-8') as f:
         transcript_text = f.read()
 
-    video_title = video_info.get('title', 'Unknown')
-    channel = video_info.get('channel', 'Unknown')
-
-    print(f"\nProcessing: {video_title}")
+    print(f"\nProcessing: {video_info.get('title', 'Unknown')}")
     print(f"  Video ID: {video_id}")
-    print(f"  Channel: {channel}")
+    print(f"  Channel: {video_info.get('channel', 'Unknown')}")
     print(f"  Transcript: {len(transcript_text)} characters")
 
     # Chunk the transcript
-    chunks = chunk_transcript(transcript_text)
-    print(f"  Chunks: {len(chunks)}")
+    chunks, merged, skipped = drop_low_signal_chunks(chunk_transcript(transcript_text))
+    print(f"  Chunks: {len(chunks)}", end='')
+    if merged or skipped:
+        print(f" ({merged} short merged, {skipped} repetitive skipped)", end='')
+    print()
 
-    if dry_run:
-        print(f"  [DRY RUN] Would process {len(chunks)} chunks with Claude API")
-        return None
+    return video_info, chunks
 
-    # Process each chunk
-    extractions = []
-    for i, chunk in enumerate(chunks, 1):
-        print(f"  Processing chunk {i}/{len(chunks)}...", end=' ')
 
-        result = extract_with_claude(
-            chunk,
-            video_title,
-            channel,
-            i,
-            len(chunks)
-        )
+def save_extraction(video_info, extractions, chunks_processed):
+    """Merge a video's chunk extractions, save them and mark the video as done (the caller saves the DB)."""
+    video_id = video_info['video_id']
 
-        if result:
-            tips_count = len(result.get('tips', []))
-            workflows_count = len(result.get('workflows', []))
-            print(f"Found {tips_count} tips, {workflows_count} workflows")
-            extractions.append(result)
-        else:
-            print("No results")
-
-    # Merge all extractions
+    # Merge all extractions; tools come from the merged text rather than the API
     merged = merge_extractions(extractions)
+    merged['tools_mentioned'] = find_tools_mentioned(merged)
 
     # Add metadata
     merged['video_id'] = video_id
-    merged['video_title'] = video_title
-    merged['channel'] = channel
+    merged['video_title'] = video_info.get('title', 'Unknown')
+    merged['channel'] = video_info.get('channel', 'Unknown')
     merged['extracted_at'] = datetime.now().isoformat()
-    merged['chunks_processed'] = len(chunks)
+    merged['chunks_processed'] = chunks_processed
 
     # Save individual extraction file
     EXTRACTED_DIR.mkdir(parents=True, exist_ok=True)
     extraction_file = EXTRACTED_DIR / f"{video_id}_knowledge.json"
-    with open(extraction_file, 'w', encoding='utf-8') as f:
-        json.dump(merged, f, indent=2)
+    write_json(extraction_file, merged)
 
     print(f"\n  Extraction complete:")
     print(f"    Tips: {len(merged['tips'])}")
@@ -447,18 +699,76 @@ def process_transcript(video_id, force=False, dry_run=False):
     video_info['llm_extraction_date'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     video_info['llm_tips_count'] = len(merged['tips'])
     video_info['llm_workflows_count'] = len(merged['workflows'])
-    save_database(db)
 
     return merged
 
 
-def process_all_transcripts(force=False, dry_run=False):
-    """Process all unprocessed transcripts."""
+def print_chunk_result(i, total_chunks, result):
+    """Print the one-line summary for an extracted chunk."""
+    print(f"  Chunk {i}/{total_chunks}:", end=' ')
+    if result:
+        tips_count = len(result.get('tips', []))
+        workflows_count = len(result.get('workflows', []))
+        print(f"Found {tips_count} tips, {workflows_count} workflows")
+    else:
+        print("No results")
+
+
+def print_session_tokens():
+    """Print this session's token usage, if any API calls were made."""
+    if SESSION_TOKENS['api_calls'] > 0:
+        print(f"\nSession Token Usage:")
+        print(f"  Input tokens:  {SESSION_TOKENS['input']:,}")
+        print(f"  Output tokens: {SESSION_TOKENS['output']:,}")
+        print(f"  Total tokens:  {SESSION_TOKENS['total']:,}")
+        print(f"  API calls:     {SESSION_TOKENS['api_calls']}")
+
+
+def extract_chunks(video_info, chunks):
+    """Extract every chunk of a video, CHUNK_WORKERS at a time. Returns results in chunk order."""
+    video_title = video_info.get('title', 'Unknown')
+    channel = video_info.get('channel', 'Unknown')
+
+    def extract(numbered_chunk):
+        i, chunk = numbered_chunk
+        return extract_with_claude(chunk, video_title, channel, i, len(chunks))
+
+    # Each chunk is a separate API round trip, so they run in parallel
+    with ThreadPoolExecutor(max_workers=CHUNK_WORKERS) as executor:
+        return list(executor.map(extract, enumerate(chunks, 1)))
+
+
+def process_transcript(video_id, force=False, dry_run=False):
+    """Process a single transcript and extract knowledge."""
     db = load_database()
 
-    processed = 0
+    prepared = prepare_transcript(db, video_id, force)
+    if not prepared:
+        return None
+    video_info, chunks = prepared
+
+    if dry_run:
+        print(f"  [DRY RUN] Would process {len(chunks)} chunks with Claude API")
+        return None
+
+    print(f"  Processing {len(chunks)} chunks...")
+    results = extract_chunks(video_info, chunks)
+
+    extractions = []
+    for i, result in enumerate(results, 1):
+        print_chunk_result(i, len(chunks), result)
+        if result:
+            extractions.append(result)
+
+    merged = save_extraction(video_info, extractions, len(chunks))
+    save_database(db)
+    return merged
+
+
+def pending_video_ids(db, force=False):
+    """Video IDs with a transcript that still need extracting, and how many were skipped."""
+    pending = []
     skipped = 0
-    errors = 0
 
     for tutorial in db.get('tutorials', []):
         video_id = tutorial.get('video_id')
@@ -474,16 +784,13 @@ def process_all_transcripts(force=False, dry_run=False):
             skipped += 1
             continue
 
-        result = process_transcript(video_id, force=force, dry_run=dry_run)
-        if result:
-            processed += 1
-        else:
-            if not dry_run:
-                errors += 1
+        pending.append(video_id)
+
+    return pending, skipped
 
-    # Finalize session token tracking
-    finalize_session()
 
+def print_summary(processed, skipped, errors):
+    """Print the end-of-run summary."""
     print(f"\n{'='*50}")
     print(f"Processing complete:")
     print(f"  Processed: {processed}")
@@ -491,93 +798,246 @@ def process_all_transcripts(force=False, dry_run=False):
     print(f"  Errors: {errors}")
 
     # Show session token usage
-    if SESSION_TOKENS['api_calls'] > 0:
-        print(f"\nSession Token Usage:")
-        print(f"  Input tokens:  {SESSION_TOKENS['input']:,}")
-        print(f"  Output tokens: {SESSION_TOKENS['output']:,}")
-        print(f"  Total tokens:  {SESSION_TOKENS['total']:,}")
-        print(f"  API calls:     {SESSION_TOKENS['api_calls']}")
+    print_session_tokens()
 
 
-def aggregate_all_knowledge():
-    """Aggregate all extracted knowledge into master files."""
-    all_tips = []
-    all_workflows = []
-    all_prompts = []
-    all_insights = []
+def process_all_transcripts(force=False, dry_run=False):
+    """Process all unprocessed transcripts, VIDEO_WORKERS videos at a time."""
+    db = load_database()
 
-    # Load all extraction files
-    for extraction_file in EXTRACTED_DIR.glob("*_knowledge.json"):
-        with open(extraction_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+    pending, skipped = pending_video_ids(db, force)
+    jobs = {}  # video_id -> (video_info, chunks)
+    for video_id in pending:
+        if video_id in jobs:
+            continue  # Listed twice in the database
+        prepared = prepare_transcript(db, video_id, force)
+        if not prepared:
+            continue
+        jobs[video_id] = prepared
+        if dry_run:
+            print(f"  [DRY RUN] Would process {len(prepared[1])} chunks with Claude API")
 
-        video_id = data.get('video_id', extraction_file.stem.replace('_knowledge', ''))
-        video_title = data.get('video_title', 'Unknown')
+    processed = 0
+    errors = 0 if dry_run else len(pending) - len(jobs)
+
+    if jobs and not dry_run:
+        print(f"\nExtracting {len(jobs)} videos...")
+
+        # Videos are extracted in parallel; results come back in order, so the
+        # report, extraction files and DB updates below stay on this thread
+        _stop_requested.clear()
+        with ThreadPoolExecutor(max_workers=VIDEO_WORKERS) as executor:
+            all_results = executor.map(lambda job: extract_chunks(*job), jobs.values())
+
+            try:
+                for (video_info, chunks), results in zip(jobs.values(), all_results):
+                    print(f"\n{video_info.get('title', 'Unknown')}")
+                    for i, result in enumerate(results, 1):
+                        print_chunk_result(i, len(chunks), result)
+
+                    save_extraction(video_info, [result for result in results if result], len(chunks))
+                    processed += 1
+
+                    # The DB is saved once at the end; checkpoint so a crash loses little
+                    # (and anything lost is re-extracted from the response cache)
+                    if processed % CHECKPOINT_EVERY == 0:
+                        save_database(db)
+            except KeyboardInterrupt:
+                # Drop the queued videos and stop sending chunks; requests already sent
+                # still finish and are cached, so a re-run doesn't pay for them again
+                print("\nInterrupted - finishing requests in flight and saving progress...")
+                _stop_requested.set()
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    if processed:
+        save_database(db)
 
-        # Add source info to each item
-        for tip in data.get('tips', []):
-            tip['source_video'] = video_id
-            tip['source_title'] = video_title
-            all_tips.append(tip)
+    # Finalize session token tracking
+    finalize_session()
 
-        for workflow in data.get('workflows', []):
-            workflow['source_video'] = video_id
-            workflow['source_title'] = video_title
-            all_workflows.append(workflow)
+    print_summary(processed, skipped, errors)
 
-        for prompt in data.get('prompts', []):
-            prompt['source_video'] = video_id
-            prompt['source_title'] = video_title
-            all_prompts.append(prompt)
 
-        for insight in data.get('insights', []):
-            insight['source_video'] = video_id
-            insight['source_title'] = video_title
-            all_insights.append(insight)
+def load_pending_batches():
+    """IDs of submitted batches whose results haven't been collected yet."""
+    if PENDING_BATCHES_FILE.exists():
+        return read_json(PENDING_BATCHES_FILE)['batch_ids']
+    return []
+
+
+def save_pending_batches(batch_ids):
+    """Record the batches still to collect (removing the file once there are none)."""
+    if batch_ids:
+        write_json(PENDING_BATCHES_FILE, {'batch_ids': batch_ids})
+    else:
+        PENDING_BATCHES_FILE.unlink(missing_ok=True)
+
+
+def split_batch_requests(requests):
+    """Group {custom_id: params} into batches within the API's request-count and size limits."""
+    groups = [[]]
+    group_bytes = 0
+    for custom_id, params in requests.items():
+        request = {'custom_id': custom_id, 'params': params}
+        request_bytes = len(json.dumps(request).encode('utf-8'))
+        if groups[-1] and (len(groups[-1]) >= BATCH_MAX_REQUESTS
+                           or group_bytes + request_bytes > BATCH_MAX_BYTES):
+            groups.append([])
+            group_bytes = 0
+        groups[-1].append(request)
+        group_bytes += request_bytes
+    return groups
+
+
+def process_all_transcripts_batch(force=False, resume_ids=None):
+    """
+    Process all unprocessed transcripts through the Message Batches API.
+    Batched requests cost half as much but can take up to 24 hours to finish.
+    Batches submitted by an earlier, interrupted run (or given as resume_ids)
+    are collected instead of submitting the same chunks again.
+    """
+    client = get_client()
+    if not client:
+        return
+
+    db = load_database()
+
+    pending, skipped = pending_video_ids(db, force)
+    jobs = {}  # video_id -> (video_info, chunks)
+    results = {}  # video_id -> extraction per chunk, None until answered
+    requests = {}  # custom_id -> request params, for chunks not in the cache
+    for video_id in pending:
+        if video_id in jobs:
+            continue  # Listed twice in the database
+        prepared = prepare_transcript(db, video_id, force)
+        if not prepared:
+            continue
+        video_info, chunks = prepared
+        jobs[video_id] = prepared
+        results[video_id] = []
+        for i, chunk in enumerate(chunks, 1):
+            params = build_request(chunk, video_info.get('title', 'Unknown'),
+                                   video_info.get('channel', 'Unknown'), i, len(chunks))
+            cached = load_cached_extraction(params)
+            results[video_id].append(cached)
+            if cached is None:
+                requests[f"{video_id}-{i}"] = params
+
+    batch_ids = list(resume_ids or load_pending_batches())
+    if batch_ids:
+        print(f"\nCollecting earlier batch(es): {', '.join(batch_ids)}")
+    elif requests:
+        for group in split_batch_requests(requests):
+            batch = client.messages.batches.create(requests=group)
+            batch_ids.append(batch.id)
+            # Recorded before waiting, so an interrupted run collects it instead of paying again
+            save_pending_batches(batch_ids)
+            print(f"\nSubmitted batch {batch.id}: {len(group)} chunks")
+        print(f"{len(requests)} chunks from {len(jobs)} videos")
+
+    try:
+        for batch_id in batch_ids:
+            batch = client.messages.batches.retrieve(batch_id)
+            while batch.processing_status != 'ended':
+                time.sleep(BATCH_POLL_SECONDS)
+                batch = client.messages.batches.retrieve(batch_id)
+                counts = batch.request_counts
+                total = counts.processing + counts.succeeded + counts.errored + counts.canceled + counts.expired
+                print(f"  {batch_id}: {counts.succeeded + counts.errored} of {total} chunks done...")
+    except KeyboardInterrupt:
+        print("\nStopped waiting - the batch keeps running on Anthropic's side.")
+        print(f"Run with --batch again to collect it (recorded in {PENDING_BATCHES_FILE.name})")
+        return
+
+    # Results come back in any order - route each one to its video and chunk
+    answered = set()
+    for batch_id in batch_ids:
+        for entry in client.messages.batches.results(batch_id):
+            params = requests.get(entry.custom_id)
+            if params is None:
+                continue  # Cached since, or its video is no longer pending
+            answered.add(entry.custom_id)
+            video_id, i = entry.custom_id.rsplit('-', 1)
+            if entry.result.type == 'succeeded':
+                result = parse_extraction(entry.result.message)
+                save_cached_extraction(params, result)
+                results[video_id][int(i) - 1] = result
+            else:
+                print(f"  Chunk {i} of {video_id} failed: {entry.result.type}")
+    save_pending_batches([batch_id for batch_id in load_pending_batches() if batch_id not in batch_ids])
+    # Videos with chunks that were in none of the collected batches wait for the next run
+    unanswered = {custom_id.rsplit('-', 1)[0] for custom_id in requests if custom_id not in answered}
+
+    processed = 0
+    waiting = 0
+    errors = len(pending) - len(jobs)
+    for video_id, (video_info, chunks) in jobs.items():
+        if video_id in unanswered:
+            waiting += 1
+            continue
+        print(f"\n{video_info.get('title', 'Unknown')}")
+        for i, result in enumerate(results[video_id], 1):
+            print_chunk_result(i, len(chunks), result)
+
+        extractions = [result for result in results[video_id] if result]
+        if extractions:
+            save_extraction(video_info, extractions, len(chunks))
+            processed += 1
+        else:
+            errors += 1
+
+    if processed:
+        save_database(db)
+
+    # Finalize session token tracking
+    finalize_session()
+
+    if waiting:
+        print(f"\n{waiting} videos were not in the collected batches - run --batch again for them")
+    print_summary(processed, skipped, errors)
+
+
+def iter_extractions():
+    """Yield (video_id, video_title, data) for each extraction file, one file in memory at a time."""
+    if not EXTRACTED_DIR.is_dir():
+        return
+    with os.scandir(EXTRACTED_DIR) as entries:
+        extraction_files = [entry.path for entry in entries if entry.name.endswith('_knowledge.json')]
+
+    for extraction_file in map(Path, extraction_files):
+        data = read_json(extraction_file)
+        video_id = data.get('video_id', extraction_file.stem.replace('_knowledge', ''))
+        yield video_id, data.get('video_title', 'Unknown'), data
+
+
+def aggregate_all_knowledge():
+    """Aggregate all extracted knowledge into master files."""
+    collected = {kind: [] for kind in KNOWLEDGE_KINDS}
+
+    for video_id, video_title, data in iter_extractions():
+        # Add source info to each item
+        for kind, items in collected.items():
+            for item in data.get(kind, []):
+                item['source_video'] = video_id
+                item['source_title'] = video_title
+                items.append(item)
 
     # Save aggregated files
     EXTRACTED_DIR.mkdir(parents=True, exist_ok=True)
 
-    with open(EXTRACTED_DIR / 'all_tips.json', 'w', encoding='utf-8') as f:
-        json.dump({
-            'extracted_at': datetime.now().isoformat(),
-            'total': len(all_tips),
-            'tips': all_tips
-        }, f, indent=2)
-
-    with open(EXTRACTED_DIR / 'all_workflows.json', 'w', encoding='utf-8') as f:
-        json.dump({
-            'extracted_at': datetime.now().isoformat(),
-            'total': len(all_workflows),
-            'workflows': all_workflows
-        }, f, indent=2)
-
-    with open(EXTRACTED_DIR / 'all_prompts.json', 'w', encoding='utf-8') as f:
-        json.dump({
-            'extracted_at': datetime.now().isoformat(),
-            'total': len(all_prompts),
-            'prompts': all_prompts
-        }, f, indent=2)
-
-    with open(EXTRACTED_DIR / 'all_insights.json', 'w', encoding='utf-8') as f:
-        json.dump({
-            'extracted_at': datetime.now().isoformat(),
-            'total': len(all_insights),
-            'insights': all_insights
-        }, f, indent=2)
+    extracted_at = datetime.now().isoformat()
+    for kind, items in collected.items():
+        write_json(EXTRACTED_DIR / f'all_{kind}.json', {
+            'extracted_at': extracted_at,
+            'total': len(items),
+            kind: items
+        })
 
     print(f"Aggregated knowledge saved:")
-    print(f"  Tips: {len(all_tips)} -> all_tips.json")
-    print(f"  Workflows: {len(all_workflows)} -> all_workflows.json")
-    print(f"  Prompts: {len(all_prompts)} -> all_prompts.json")
-    print(f"  Insights: {len(all_insights)} -> all_insights.json")
+    for kind, items in collected.items():
+        print(f"  {kind.title()}: {len(items)} -> all_{kind}.json")
 
-    return {
-        'tips': len(all_tips),
-        'workflows': len(all_workflows),
-        'prompts': len(all_prompts),
-        'insights': len(all_insights)
-    }
+    return {kind: len(items) for kind, items in collected.items()}
 
 
 def show_stats():
@@ -599,25 +1059,15 @@ def show_stats():
     print(f"  Pending: {with_transcripts - processed}")
 
     # Count extracted items
-    total_tips = 0
-    total_workflows = 0
-    total_prompts = 0
-    total_insights = 0
-
-    for extraction_file in EXTRACTED_DIR.glob("*_knowledge.json"):
-        with open(extraction_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        total_tips += len(data.get('tips', []))
-        total_workflows += len(data.get('workflows', []))
-        total_prompts += len(data.get('prompts', []))
-        total_insights += len(data.get('insights', []))
+    totals = dict.fromkeys(KNOWLEDGE_KINDS, 0)
+    for _, _, data in iter_extractions():
+        for kind in KNOWLEDGE_KINDS:
+            totals[kind] += len(data.get(kind, []))
 
     print(f"\nExtracted Knowledge:")
-    print(f"  Tips: {total_tips}")
-    print(f"  Workflows: {total_workflows}")
-    print(f"  Prompts: {total_prompts}")
-    print(f"  Insights: {total_insights}")
-    print(f"  Total items: {total_tips + total_workflows + total_prompts + total_insights}")
+    for kind, total in totals.items():
+        print(f"  {kind.title()}: {total}")
+    print(f"  Total items: {sum(totals.values())}")
 
     # Show by video
     print(f"\nBy Video:")
@@ -687,13 +1137,7 @@ def export_knowledge_markdown():
     all_workflows = []
     all_prompts = []
 
-    for extraction_file in EXTRACTED_DIR.glob("*_knowledge.json"):
-        with open(extraction_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        video_title = data.get('video_title', 'Unknown')
-        video_id = data.get('video_id', '')
-
+    for video_id, video_title, data in iter_extractions():
         for tip in data.get('tips', []):
             tip['_source'] = f"[{video_title}](https://youtube.com/watch?v={video_id})"
             all_tips.append(tip)
@@ -706,10 +1150,7 @@ def export_knowledge_markdown():
             prompt['_source'] = f"[{video_title}](https://youtube.com/watch?v={video_id})"
             all_prompts.append(prompt)
 
-    # Generate Tips markdown
-    md = "# Extracted Tips\n\n"
-    md += f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}*\n\n"
-    md += f"Total tips: {len(all_tips)}\n\n---\n\n"
+    generated = f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}*\n\n"
 
     # Group by category
     tips_by_category = {}
@@ -719,55 +1160,57 @@ def export_knowledge_markdown():
             tips_by_category[category] = []
         tips_by_category[category].append(tip)
 
-    for category, tips in sorted(tips_by_category.items()):
-        md += f"## {category.replace('-', ' ').title()}\n\n"
-        for tip in tips:
-            md += f"- {tip.get('text', '')}\n"
-            md += f"  - Source: {tip.get('_source', 'Unknown')}\n"
-            if tip.get('timestamp_approx'):
-                md += f"  - Timestamp: ~{tip['timestamp_approx']}\n"
-            md += "\n"
+    # Each file is written as it is generated (buffered by the file object)
+    # rather than built up as one big string
 
+    # Generate Tips markdown
     with open(exports_dir / 'extracted_tips.md', 'w', encoding='utf-8') as f:
-        f.write(md)
+        f.write("# Extracted Tips\n\n")
+        f.write(generated)
+        f.write(f"Total tips: {len(all_tips)}\n\n---\n\n")
+
+        for category, tips in sorted(tips_by_category.items()):
+            f.write(f"## {category.replace('-', ' ').title()}\n\n")
+            for tip in tips:
+                f.write(f"- {tip.get('text', '')}\n")
+                f.write(f"  - Source: {tip.get('_source', 'Unknown')}\n")
+                if tip.get('timestamp_approx'):
+                    f.write(f"  - Timestamp: ~{tip['timestamp_approx']}\n")
+                f.write("\n")
 
     # Generate Workflows markdown
-    md = "# Extracted Workflows\n\n"
-    md += f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}*\n\n"
-    md += f"Total workflows: {len(all_workflows)}\n\n---\n\n"
-
-    for workflow in all_workflows:
-        md += f"## {workflow.get('name', 'Unnamed Workflow')}\n\n"
-        md += f"Source: {workflow.get('_source', 'Unknown')}\n\n"
+    with open(exports_dir / 'extracted_workflows.md', 'w', encoding='utf-8') as f:
+        f.write("# Extracted Workflows\n\n")
+        f.write(generated)
+        f.write(f"Total workflows: {len(all_workflows)}\n\n---\n\n")
 
-        if workflow.get('prerequisites'):
-            md += "**Prerequisites:**\n"
-            for prereq in workflow['prerequisites']:
-                md += f"- {prereq}\n"
-            md += "\n"
+        for workflow in all_workflows:
+            f.write(f"## {workflow.get('name', 'Unnamed Workflow')}\n\n")
+            f.write(f"Source: {workflow.get('_source', 'Unknown')}\n\n")
 
-        md += "**Steps:**\n"
-        for i, step in enumerate(workflow.get('steps', []), 1):
-            md += f"{i}. {step}\n"
-        md += "\n---\n\n"
+            if workflow.get('prerequisites'):
+                f.write("**Prerequisites:**\n")
+                for prereq in workflow['prerequisites']:
+                    f.write(f"- {prereq}\n")
+                f.write("\n")
 
-    with open(exports_dir / 'extracted_workflows.md', 'w', encoding='utf-8') as f:
-        f.write(md)
+            f.write("**Steps:**\n")
+            for i, step in enumerate(workflow.get('steps', []), 1):
+                f.write(f"{i}. {step}\n")
+            f.write("\n---\n\n")
 
     # Generate Prompts markdown
-    md = "# Extracted Prompts\n\n"
-    md += f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}*\n\n"
-    md += f"Total prompts: {len(all_prompts)}\n\n---\n\n"
-
-    for prompt in all_prompts:
-        md += f"## {prompt.get('purpose', 'Unnamed Prompt')}\n\n"
-        md += f"Source: {prompt.get('_source', 'Unknown')}\n\n"
-        md += "```\n"
-        md += prompt.get('text', '')
-        md += "\n```\n\n---\n\n"
-
     with open(exports_dir / 'extracted_prompts.md', 'w', encoding='utf-8') as f:
-        f.write(md)
+        f.write("# Extracted Prompts\n\n")
+        f.write(generated)
+        f.write(f"Total prompts: {len(all_prompts)}\n\n---\n\n")
+
+        for prompt in all_prompts:
+            f.write(f"## {prompt.get('purpose', 'Unnamed Prompt')}\n\n")
+            f.write(f"Source: {prompt.get('_source', 'Unknown')}\n\n")
+            f.write("```\n")
+            f.write(prompt.get('text', ''))
+            f.write("\n```\n\n---\n\n")
 
     print(f"Exported to {exports_dir}:")
     print(f"  extracted_tips.md ({len(all_tips)} tips)")
@@ -775,6 +1218,17 @@ def export_knowledge_markdown():
     print(f"  extracted_prompts.md ({len(all_prompts)} prompts)")
 
 
+def positive_int(value):
+    """argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a whole number, got {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Extract structured knowledge from transcripts using LLM',
@@ -785,6 +1239,9 @@ Examples:
   python extract_knowledge.py --video aQvpqlSiUIQ  # Process specific video
   python extract_knowledge.py --force              # Reprocess all
   python extract_knowledge.py --dry-run            # Preview without API calls
+  python extract_knowledge.py --batch              # Half-price batch (slow)
+  python extract_knowledge.py --resume-batch ID    # Collect an earlier batch
+  python extract_knowledge.py --concurrency 16     # More requests in flight
   python extract_knowledge.py stats                # Show statistics
   python extract_knowledge.py export               # Export to markdown
   python extract_knowledge.py aggregate            # Aggregate all extractions
@@ -798,7 +1255,15 @@ Requirements:
     parser.add_argument('--video', '-v', help='Process specific video ID')
     parser.add_argument('--force', '-f', action='store_true', help='Reprocess already extracted')
     parser.add_argument('--dry-run', '-n', action='store_true', help='Preview without API calls')
+    parser.add_argument('--batch', '-b', action='store_true',
+                        help='Use the Message Batches API (half price, can take hours)')
+    parser.add_argument('--resume-batch', action='append', metavar='BATCH_ID',
+                        help='Collect the results of an earlier --batch run (implies --batch)')
     parser.add_argument('--api-key', '-k', help='Anthropic API key')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Call the API even for chunks extracted before')
+    parser.add_argument('--concurrency', '-c', type=positive_int,
+                        help=f'API requests in flight at once (default: {MAX_INFLIGHT})')
 
     subparsers = parser.add_subparsers(dest='command')
     subparsers.add_parser('stats', help='Show extraction statistics')
@@ -809,9 +1274,15 @@ Requirements:
     args = parser.parse_args()
 
     # Set global API key if provided
-    global API_KEY
+    global API_KEY, USE_CACHE
     if args.api_key:
         API_KEY = args.api_key
+    if args.no_cache:
+        USE_CACHE = False
+    if args.concurrency:
+        set_concurrency(args.concurrency)
+    if USE_CACHE and not args.command:
+        migrate_flat_cache()  # Once per run, rather than on every cache lookup
 
     if args.command == 'stats':
         show_stats()
@@ -824,12 +1295,7 @@ Requirements:
     elif args.video:
         process_transcript(args.video, force=args.force, dry_run=args.dry_run)
         finalize_session()
-        if SESSION_TOKENS['api_calls'] > 0:
-            print(f"\nSession Token Usage:")
-            print(f"  Input tokens:  {SESSION_TOKENS['input']:,}")
-            print(f"  Output tokens: {SESSION_TOKENS['output']:,}")
-            print(f"  Total tokens:  {SESSION_TOKENS['total']:,}")
-            print(f"  API calls:     {SESSION_TOKENS['api_calls']}")
+        print_session_tokens()
     else:
         # Check for API key before processing
         if not args.dry_run:
@@ -842,7 +1308,12 @@ Requirements:
                 print("Use --api-key YOUR_KEY or set ANTHROPIC_API_KEY environment variable")
                 sys.exit(1)
 
-        process_all_transcripts(force=args.force, dry_run=args.dry_run)
+        if args.resume_batch:
+            process_all_transcripts_batch(force=args.force, resume_ids=args.resume_batch)
+        elif args.batch and not args.dry_run:
+            process_all_transcripts_batch(force=args.force)
+        else:
+            process_all_transcripts(force=args.force, dry_run=args.dry_run)
 
 
 if __name__ == '__main__':
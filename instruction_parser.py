@@ -4,6 +4,7 @@ Parses Linda's general instruction emails (no eBay URL) to extract actionable it
 """
 
 import re
+from urllib.parse import quote
 from typing import Dict, Optional, List
 from dataclasses import dataclass
 
@@ -175,7 +176,6 @@ class InstructionParser:
 
 def generate_seller_hub_url(search_term: str) -> str:
     """Generate a Seller Hub search URL for the given term."""
-    from urllib.parse import quote
     return f"https://www.ebay.com/sh/lst/active?search={quote(search_term)}"
 
 
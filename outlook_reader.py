@@ -4,7 +4,7 @@ Uses COM automation to read emails from Outlook Classic
 """
 
 import win32com.client
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 from datetime import datetime
 
 
@@ -128,18 +128,7 @@ class OutlookReader:
                 if unread_only and item.UnRead == False:
                     continue
 
-                email_data = {
-                    'subject': item.Subject,
-                    'sender': item.SenderName,
-                    'sender_email': self._get_sender_email(item),
-                    'received': item.ReceivedTime,
-                    'body': item.Body,
-                    'html_body': getattr(item, 'HTMLBody', ''),
-                    'unread': item.UnRead,
-                    'entry_id': item.EntryID,
-                    'attachments': [att.FileName for att in item.Attachments] if item.Attachments.Count > 0 else []
-                }
-                emails.append(email_data)
+                emails.append(self._email_data(item))
                 count += 1
 
         except Exception as e:
@@ -147,6 +136,56 @@ class OutlookReader:
 
         return emails
 
+    def iter_unread(self, folder, restriction: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Yield unread emails from a folder, newest first, one at a time.
+
+        Outlook filters the folder with Items.Restrict, so read messages are
+        never fetched, and each email's fields are only read from Outlook when
+        the caller advances the generator. Stop iterating once you have enough.
+
+        Args:
+            folder: Outlook folder object
+            restriction: Optional extra Restrict filter, ANDed with [UnRead] = True
+
+        Yields:
+            Email dictionaries in the same format as read_emails()
+        """
+        query = "[UnRead] = True"
+        if restriction:
+            query = f"{query} AND ({restriction})"
+        try:
+            items = folder.Items.Restrict(query)
+            items.Sort("[ReceivedTime]", True)  # Sort by newest first
+        except Exception as e:
+            print(f"Error reading emails: {e}")
+            return
+
+        for item in items:
+            # Check if it's a mail item (not meeting request, etc.)
+            if item.Class != 43:  # 43 = olMail
+                continue
+            try:
+                email_data = self._email_data(item)
+            except Exception as e:
+                print(f"Error reading email: {e}")
+                continue
+            yield email_data
+
+    def _email_data(self, item) -> Dict:
+        """Build the email dictionary for an Outlook mail item."""
+        return {
+            'subject': item.Subject,
+            'sender': item.SenderName,
+            'sender_email': self._get_sender_email(item),
+            'received': item.ReceivedTime,
+            'body': item.Body,
+            'html_body': getattr(item, 'HTMLBody', ''),
+            'unread': item.UnRead,
+            'entry_id': item.EntryID,
+            'attachments': [att.FileName for att in item.Attachments] if item.Attachments.Count > 0 else []
+        }
+
     def _get_sender_email(self, item) -> str:
         """Extract sender email address."""
         try:
@@ -170,6 +209,31 @@ class OutlookReader:
             print(f"Error marking email as read: {e}")
             return False
 
+    def mark_as_read_bulk(self, entry_ids: List[str]) -> int:
+        """
+        Mark several emails as read by their EntryIDs.
+
+        Outlook's COM API has no bulk update, so each item is still fetched and
+        saved on its own; this only keeps the loop in one place. Items that are
+        already read are skipped, and a failure on one item does not stop the
+        rest of the batch.
+
+        Returns:
+            Number of emails that were unread and are now marked as read
+        """
+        marked = 0
+        for entry_id in entry_ids:
+            try:
+                item = self.namespace.GetItemFromID(entry_id)
+                if not item.UnRead:
+                    continue
+                item.UnRead = False
+                item.Save()
+                marked += 1
+            except Exception as e:
+                print(f"Error marking email as read: {e}")
+        return marked
+
     def mark_as_unread(self, entry_id: str) -> bool:
         """Mark an email as unread by its EntryID."""
         try:
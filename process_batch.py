@@ -2,10 +2,10 @@
 Process a batch: mark previous as read, get next batch, open in Chrome
 """
 import os
-import subprocess
 from outlook_reader import OutlookReader
 from email_parser import EmailParser
 from config import OUTLOOK_CONFIG
+from chrome_launcher import launch_chrome
 
 PENDING_FILE = os.path.join(os.path.dirname(__file__), 'pending_entries.txt')
 COMPLETED_FILE = os.path.join(os.path.dirname(__file__), 'completed_items.txt')
@@ -21,9 +21,10 @@ def load_completed():
 
 def save_completed(item_ids):
     """Append item IDs to completed file."""
+    if not item_ids:
+        return
     with open(COMPLETED_FILE, 'a', encoding='utf-8') as f:
-        for item_id in item_ids:
-            f.write(f"{item_id}\n")
+        f.write('\n'.join(item_ids) + '\n')
 
 def mark_previous_read(reader):
     """Mark previous batch emails as read and log as completed."""
@@ -39,7 +40,7 @@ def mark_previous_read(reader):
     completed_ids = []
     count = 0
     for line in lines:
-        parts = line.strip().split('|')
+        parts = line.strip().split('|', 2)
         if len(parts) >= 2:
             entry_id = parts[0]
             item_id = parts[1]
@@ -69,13 +70,11 @@ def get_next_batch(reader, limit=10):
     if completed:
         print(f"Skipping {len(completed)} already-completed items")
 
-    # Get more emails than needed since some may be skipped
-    emails = reader.read_emails(folder, limit=limit * 3, unread_only=True)
-
     parser = EmailParser()
     listings = []
 
-    for email in emails:
+    # Emails are read lazily, so nothing past the last one needed is fetched
+    for email in reader.iter_unread(folder):
         if len(listings) >= limit:
             break
         parsed = parser.parse_email(email)
@@ -92,16 +91,13 @@ def get_next_batch(reader, limit=10):
 
     # Save for next time
     with open(PENDING_FILE, 'w', encoding='utf-8') as f:
-        for l in listings:
-            f.write(f"{l['entry_id']}|{l['item_id']}|{l['price']}\n")
+        f.write(''.join(f"{l['entry_id']}|{l['item_id']}|{l['price']}\n" for l in listings))
 
     return listings
 
 def open_in_chrome(listings):
     """Open item pages in Chrome."""
-    urls = [f"https://www.ebay.com/itm/{l['item_id']}" for l in listings]
-    cmd = ['start', 'chrome'] + urls
-    subprocess.run(' '.join(cmd), shell=True)
+    launch_chrome([f"https://www.ebay.com/itm/{l['item_id']}" for l in listings])
 
 def main():
     reader = OutlookReader()
@@ -3,7 +3,7 @@ Process the email export from VBA macro
 Opens eBay items in Chrome and tracks completed items
 """
 import os
-import subprocess
+from chrome_launcher import launch_chrome
 
 SCRIPT_DIR = os.path.dirname(__file__)
 EXPORT_FILE = os.path.join(SCRIPT_DIR, 'email_export.txt')
@@ -21,9 +21,10 @@ def load_completed():
 
 def save_completed(item_ids):
     """Append item IDs to completed file."""
+    if not item_ids:
+        return
     with open(COMPLETED_FILE, 'a', encoding='utf-8') as f:
-        for item_id in item_ids:
-            f.write(f"{item_id}\n")
+        f.write('\n'.join(item_ids) + '\n')
 
 
 def load_export():
@@ -93,9 +94,7 @@ def open_in_chrome(listings):
     """Open item pages in Chrome."""
     if not listings:
         return
-    urls = [f"https://www.ebay.com/itm/{l['item_id']}" for l in listings]
-    cmd = ['start', 'chrome'] + urls
-    subprocess.run(' '.join(cmd), shell=True)
+    launch_chrome([f"https://www.ebay.com/itm/{l['item_id']}" for l in listings])
 
 
 def main():
@@ -38,6 +38,7 @@ KB_SCRIPTS = [
     'knowledge_db.py',
     'youtube_metadata.py',
     'transcript_analyzer.py',
+    'tool_patterns.py',
     'transcript_search.py',
     'style_code_gallery.py',
     'model_tracker.py',
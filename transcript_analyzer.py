@@ -12,6 +12,8 @@ from datetime import datetime
 from pathlib import Path
 from collections import Counter, defaultdict
 
+from tool_patterns import TOOLS, extract_tools
+
 # Paths
 MASTER_DB_PATH = r'D:\AI-Knowledge-Base\master_db.json'
 TRANSCRIPTS_PATH = r'D:\AI-Knowledge-Base\tutorials\transcripts'
@@ -22,55 +24,6 @@ EXTRACTED_PATH = r'D:\AI-Knowledge-Base\extracted'
 # DETECTION PATTERNS
 # =============================================================================
 
-# AI/Coding Tools to detect
-TOOLS = {
-    # AI Coding Assistants
-    'claude code': ['claude code', 'claudecode'],
-    'cursor': ['cursor'],
-    'github copilot': ['copilot', 'github copilot'],
-    'codeium': ['codeium'],
-    'tabnine': ['tabnine'],
-    'replit': ['replit'],
-    'windsurf': ['windsurf'],
-    'aider': ['aider'],
-    'cline': ['cline'],
-    'continue': ['continue dev', 'continue.dev'],
-    'bolt': ['bolt.new', 'bolt new'],
-    'lovable': ['lovable'],
-    'v0': ['v0.dev', 'v zero'],
-
-    # AI Models/Services
-    'claude': ['claude', 'anthropic'],
-    'chatgpt': ['chatgpt', 'chat gpt', 'gpt-4', 'gpt 4', 'openai'],
-    'gemini': ['gemini', 'google ai'],
-    'grok': ['grok'],
-    'llama': ['llama', 'meta ai'],
-    'mistral': ['mistral'],
-    'perplexity': ['perplexity'],
-
-    # Development Tools
-    'vs code': ['vs code', 'vscode', 'visual studio code'],
-    'neovim': ['neovim', 'nvim'],
-    'vim': ['vim'],
-    'terminal': ['terminal', 'command line', 'cli'],
-    'git': ['git', 'github', 'gitlab'],
-    'docker': ['docker', 'container'],
-    'node': ['node', 'nodejs', 'npm'],
-    'python': ['python', 'pip'],
-
-    # AI Image/Video
-    'midjourney': ['midjourney', 'mid journey'],
-    'stable diffusion': ['stable diffusion', 'sdxl', 'sd3'],
-    'dall-e': ['dall-e', 'dalle'],
-    'flux': ['flux'],
-    'comfyui': ['comfyui', 'comfy ui'],
-
-    # Productivity
-    'notion': ['notion'],
-    'obsidian': ['obsidian'],
-    'notebooklm': ['notebooklm', 'notebook lm'],
-}
-
 # Command patterns to detect
 COMMAND_PATTERNS = [
     # Claude Code commands
@@ -212,21 +165,6 @@ def load_timestamped_transcript(video_id):
 # EXTRACTION FUNCTIONS
 # =============================================================================
 
-def extract_tools(text):
-    """Extract mentioned tools from transcript."""
-    text_lower = text.lower()
-    found_tools = {}
-
-    for tool_name, patterns in TOOLS.items():
-        count = 0
-        for pattern in patterns:
-            count += len(re.findall(r'\b' + re.escape(pattern) + r'\b', text_lower))
-        if count > 0:
-            found_tools[tool_name] = count
-
-    # Sort by frequency
-    return dict(sorted(found_tools.items(), key=lambda x: x[1], reverse=True))
-
 def extract_commands(text):
     """Extract CLI commands from transcript."""
     found_commands = []
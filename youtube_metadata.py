@@ -8,7 +8,13 @@ sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 import json
 import os
 import re
-from datetime import datetime
+import time
+import random
+import threading
+import http.client
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
 
 # Third-party imports
@@ -31,39 +37,133 @@ except ImportError:
     YTDLP_AVAILABLE = False
     print("Warning: yt-dlp not installed. Run: pip install yt-dlp")
 
+# Optional: faster JSON for the (large) master DB; stdlib json is used otherwise
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional: stream large DBs for read-only reports instead of loading them whole
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # Paths
 MASTER_DB_PATH = r'D:\AI-Knowledge-Base\master_db.json'
 TRANSCRIPTS_PATH = r'D:\AI-Knowledge-Base\tutorials\transcripts'
 METADATA_CACHE_PATH = r'D:\AI-Knowledge-Base\youtube_metadata_cache.json'
+METADATA_FAILURES_PATH = r'D:\AI-Knowledge-Base\youtube_metadata_failures.json'
+
+# Videos YouTube reported as gone are not asked for again for this many days
+FAILURE_RETRY_DAYS = 30
+# yt-dlp error text that means the video itself is gone (not a network hiccup)
+UNAVAILABLE_MARKERS = ('video unavailable', 'private video', 'has been removed', 'http error 404')
+
+# Videos fetched in parallel by process_all_tutorials (network-bound, so threads)
+FETCH_WORKERS = 4
+
+# Read-only reports stream the DB (with ijson) once it is bigger than this
+STREAM_DB_THRESHOLD = 50 * 1024 * 1024
+
+# Optional YouTube Data API v3 key: metadata is then fetched for up to
+# API_BATCH_SIZE videos per request, with yt-dlp as the fallback
+YOUTUBE_API_KEY = os.environ.get('YT_API_KEY')
+VIDEOS_API_HOST = 'www.googleapis.com'
+VIDEOS_API_PATH = '/youtube/v3/videos'
+API_BATCH_SIZE = 50
+
+# process_all_tutorials saves its progress after this many tutorials
+CHECKPOINT_EVERY = 25
+
+# Request rate shared by all fetch workers; up to REQUEST_BURST may go out back to back
+REQUESTS_PER_SECOND = 2.0
+REQUEST_BURST = 4
+
+# Retries for throttled/failed requests: RETRY_BASE_SECONDS * 2^attempt plus jitter
+FETCH_RETRIES = 5
+RETRY_BASE_SECONDS = 0.5
 
 # =============================================================================
 # DATABASE FUNCTIONS
 # =============================================================================
 
+def read_json(path):
+    """Read a JSON file (orjson if available)."""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def write_json(path, data):
+    """
+    Write a JSON file, 2-space indented UTF-8 (orjson if available).
+    Written to a temp file and swapped in, so a crash never leaves a half-written file.
+    """
+    tmp_path = path + '.tmp'
+    if ORJSON_AVAILABLE:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
 def load_db():
     """Load the master database."""
     if os.path.exists(MASTER_DB_PATH):
-        with open(MASTER_DB_PATH, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return read_json(MASTER_DB_PATH)
     return None
 
 def save_db(db):
     """Save the master database."""
     db['metadata']['last_updated'] = datetime.now().strftime('%Y-%m-%d')
-    with open(MASTER_DB_PATH, 'w', encoding='utf-8') as f:
-        json.dump(db, f, indent=2, ensure_ascii=False)
+    write_json(MASTER_DB_PATH, db)
+
+def iter_tutorials():
+    """
+    Yield the DB's tutorials for read-only use, or return None if there is no DB.
+    Large DBs are streamed one tutorial at a time when ijson is installed.
+    """
+    if not os.path.exists(MASTER_DB_PATH):
+        return None
+    if IJSON_AVAILABLE and os.path.getsize(MASTER_DB_PATH) > STREAM_DB_THRESHOLD:
+        def stream():
+            with open(MASTER_DB_PATH, 'rb') as f:
+                yield from ijson.items(f, 'tutorials.item')
+        return stream()
+    return iter(load_db().get('tutorials', []))
 
 def load_metadata_cache():
     """Load the metadata cache."""
     if os.path.exists(METADATA_CACHE_PATH):
-        with open(METADATA_CACHE_PATH, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return read_json(METADATA_CACHE_PATH)
     return {}
 
 def save_metadata_cache(cache):
     """Save the metadata cache."""
-    with open(METADATA_CACHE_PATH, 'w', encoding='utf-8') as f:
-        json.dump(cache, f, indent=2, ensure_ascii=False)
+    write_json(METADATA_CACHE_PATH, cache)
+
+def load_metadata_failures():
+    """Load the video_id -> failed_at record of unavailable videos."""
+    if os.path.exists(METADATA_FAILURES_PATH):
+        return read_json(METADATA_FAILURES_PATH)
+    return {}
+
+def save_metadata_failures(failures):
+    """Save the unavailable-video record."""
+    write_json(METADATA_FAILURES_PATH, failures)
+
+def recently_failed(failures, video_id):
+    """True if the video was reported unavailable within FAILURE_RETRY_DAYS."""
+    failed_at = failures.get(video_id)
+    if not failed_at:
+        return False
+    age = datetime.now() - datetime.strptime(failed_at, '%Y-%m-%d %H:%M:%S')
+    return age < timedelta(days=FAILURE_RETRY_DAYS)
 
 def ensure_transcript_dir():
     """Ensure the transcripts directory exists."""
@@ -73,86 +173,219 @@ def ensure_transcript_dir():
 # YOUTUBE METADATA EXTRACTION
 # =============================================================================
 
+# watch?v=, youtu.be/, embed/ and v/ URLs in one pass
+VIDEO_URL_PATTERN = re.compile(r'(?:youtube\.com/(?:watch\?v=|embed/|v/)|youtu\.be/)([\w\-]+)')
+VIDEO_ID_PATTERN = re.compile(r'^[\w\-]{11}$')
+
 def extract_video_id(url):
     """Extract video ID from various YouTube URL formats."""
-    patterns = [
-        r'youtube\.com/watch\?v=([\w\-]+)',
-        r'youtu\.be/([\w\-]+)',
-        r'youtube\.com/embed/([\w\-]+)',
-        r'youtube\.com/v/([\w\-]+)',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-
-    # If it looks like just a video ID
-    if re.match(r'^[\w\-]{11}$', url):
+    # If it looks like just a video ID (can't also be a URL: no '.' or '/')
+    if VIDEO_ID_PATTERN.match(url):
         return url
 
-    return None
+    match = VIDEO_URL_PATTERN.search(url)
+    return match.group(1) if match else None
+
+def retry_delay(attempt):
+    """Exponential backoff with jitter, so throttled workers don't retry in lockstep."""
+    return RETRY_BASE_SECONDS * (2 ** attempt) + random.uniform(0, 0.25)
+
+_rate_lock = threading.Lock()
+_next_request_at = 0.0
+
+def wait_for_request_slot():
+    """Block until the shared rate limit (a token bucket) allows another YouTube request."""
+    global _next_request_at
+    interval = 1 / REQUESTS_PER_SECOND
+    with _rate_lock:
+        now = time.monotonic()
+        # Idle time banks up to REQUEST_BURST requests' worth of slots
+        slot = max(_next_request_at, now - (REQUEST_BURST - 1) * interval)
+        _next_request_at = slot + interval
+    if slot > now:
+        time.sleep(slot - now)
+
+# yt-dlp and transcript clients, one per thread (neither is safe to share
+# between the fetch workers)
+_clients = threading.local()
+
+def get_ydl():
+    """
+    Return this thread's yt-dlp instance, creating it on first use.
+    Reusing one instance keeps its HTTP session (and open connections to
+    YouTube) alive across videos instead of reconnecting for each one.
+    """
+    ydl = getattr(_clients, 'ydl', None)
+    if ydl is None:
+        ydl_opts = {
+            'quiet': True,
+            'no_warnings': True,
+            'extract_flat': False,
+            'skip_download': True,
+            'retries': FETCH_RETRIES,
+            'extractor_retries': FETCH_RETRIES,
+            'retry_sleep_functions': {'http': retry_delay, 'extractor': retry_delay},
+        }
+        ydl = _clients.ydl = yt_dlp.YoutubeDL(ydl_opts)
+    return ydl
 
-def get_video_metadata(video_id):
+def get_video_metadata(video_id, failures=None):
     """
     Fetch video metadata using yt-dlp.
     Returns dict with title, description, channel, duration, etc.
+    If failures is given, videos YouTube reports as unavailable are recorded in it.
     """
     if not YTDLP_AVAILABLE:
         return None
 
     url = f"https://www.youtube.com/watch?v={video_id}"
 
-    ydl_opts = {
-        'quiet': True,
-        'no_warnings': True,
-        'extract_flat': False,
-        'skip_download': True,
-    }
-
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-
-            return {
-                'video_id': video_id,
-                'title': info.get('title'),
-                'description': info.get('description'),
-                'channel': info.get('channel') or info.get('uploader'),
-                'channel_id': info.get('channel_id'),
-                'duration': info.get('duration'),  # in seconds
-                'duration_string': info.get('duration_string'),
-                'view_count': info.get('view_count'),
-                'like_count': info.get('like_count'),
-                'upload_date': info.get('upload_date'),  # YYYYMMDD format
-                'categories': info.get('categories', []),
-                'tags': info.get('tags', []),
-                'thumbnail': info.get('thumbnail'),
-                'fetched_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
+        wait_for_request_slot()
+        info = get_ydl().extract_info(url, download=False)
+
+        return {
+            'video_id': video_id,
+            'title': info.get('title'),
+            'description': info.get('description') or '',
+            'channel': info.get('channel') or info.get('uploader'),
+            'channel_id': info.get('channel_id'),
+            'duration': info.get('duration'),  # in seconds
+            'duration_string': info.get('duration_string'),
+            'view_count': info.get('view_count'),
+            'like_count': info.get('like_count'),
+            'upload_date': info.get('upload_date'),  # YYYYMMDD format
+            'categories': info.get('categories', []),
+            'tags': info.get('tags') or [],
+            'thumbnail': info.get('thumbnail'),
+            'fetched_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
 
     except Exception as e:
         print(f"    Error fetching metadata for {video_id}: {e}")
+        if failures is not None and any(m in str(e).lower() for m in UNAVAILABLE_MARKERS):
+            failures[video_id] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         return None
 
+ISO_DURATION_PATTERN = re.compile(r'P(?:(\d+)D)?T?(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+
+def parse_iso_duration(value):
+    """Convert an ISO 8601 duration (e.g. PT1H2M3S) to seconds."""
+    match = ISO_DURATION_PATTERN.fullmatch(value or '')
+    if not match:
+        return None
+    days, hours, minutes, seconds = (int(g or 0) for g in match.groups())
+    return ((days * 24 + hours) * 60 + minutes) * 60 + seconds
+
+def format_duration(seconds):
+    """Format seconds the way yt-dlp's duration_string does (1:02:03, 2:03, 3)."""
+    if seconds is None:
+        return None
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    if minutes:
+        return f"{minutes}:{secs:02d}"
+    return str(secs)
+
+def get_video_metadata_batch(video_ids, api_key):
+    """
+    Fetch metadata for many videos with the YouTube Data API, API_BATCH_SIZE per request.
+    Returns {video_id: metadata} in the same format as get_video_metadata().
+    Videos the API leaves out (private, deleted) are simply missing from the result.
+    """
+    results = {}
+    # One keep-alive connection for all batches instead of a TLS handshake per request
+    connection = http.client.HTTPSConnection(VIDEOS_API_HOST, timeout=30)
+    try:
+        for start in range(0, len(video_ids), API_BATCH_SIZE):
+            batch = video_ids[start:start + API_BATCH_SIZE]
+            query = urllib.parse.urlencode({
+                'part': 'snippet,contentDetails,statistics',
+                'id': ','.join(batch),
+                'key': api_key,
+            })
+            try:
+                wait_for_request_slot()
+                try:
+                    connection.request('GET', f"{VIDEOS_API_PATH}?{query}")
+                    response = connection.getresponse()
+                except ConnectionError:
+                    # The server closed the idle connection; open a new one and resend
+                    connection.close()
+                    connection.request('GET', f"{VIDEOS_API_PATH}?{query}")
+                    response = connection.getresponse()
+                body = response.read()
+                if response.status != 200:
+                    raise Exception(f"HTTP Error {response.status}: {response.reason}")
+                data = json.loads(body)
+            except Exception as e:
+                # Quota or key problems affect every batch - leave the rest to yt-dlp
+                print(f"    Error fetching metadata batch from the YouTube API: {e}")
+                break
+
+            for item in data.get('items', []):
+                snippet = item.get('snippet', {})
+                statistics = item.get('statistics', {})
+                duration = parse_iso_duration(item.get('contentDetails', {}).get('duration'))
+                thumbnails = snippet.get('thumbnails', {})
+                thumbnail = next((thumbnails[size]['url'] for size in ('maxres', 'standard', 'high', 'medium', 'default')
+                                  if size in thumbnails), None)
+                results[item['id']] = {
+                    'video_id': item['id'],
+                    'title': snippet.get('title'),
+                    'description': snippet.get('description') or '',
+                    'channel': snippet.get('channelTitle'),
+                    'channel_id': snippet.get('channelId'),
+                    'duration': duration,  # in seconds
+                    'duration_string': format_duration(duration),
+                    'view_count': int(statistics['viewCount']) if 'viewCount' in statistics else None,
+                    'like_count': int(statistics['likeCount']) if 'likeCount' in statistics else None,
+                    'upload_date': (snippet.get('publishedAt') or '')[:10].replace('-', '') or None,  # YYYYMMDD format
+                    'categories': [],  # The API only gives a category ID
+                    'tags': snippet.get('tags') or [],
+                    'thumbnail': thumbnail,
+                    'fetched_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                }
+    finally:
+        connection.close()
+    return results
+
 # =============================================================================
 # TRANSCRIPT EXTRACTION
 # =============================================================================
 
-def get_transcript(video_id, languages=['en', 'en-US', 'en-GB']):
+def get_transcript_api():
+    """Return this thread's transcript API client (one HTTP session for all its videos)."""
+    api = getattr(_clients, 'transcript_api', None)
+    if api is None:
+        api = _clients.transcript_api = YouTubeTranscriptApi()
+    return api
+
+def get_transcript(video_id, languages=['en', 'en-US', 'en-GB'], failures=None):
     """
     Fetch transcript for a YouTube video.
     Returns dict with transcript text and metadata.
+    If failures is given, videos YouTube reports as unavailable are recorded in it.
     """
     if not TRANSCRIPT_API_AVAILABLE:
         return None
 
     try:
-        # Create API instance (new API format)
-        api = YouTubeTranscriptApi()
-
-        # Fetch transcript
-        transcript_data = api.fetch(video_id)
+        # Fetch transcript (new API format), retrying transient failures;
+        # the "no transcript" errors below are final and re-raised at once
+        for attempt in range(FETCH_RETRIES + 1):
+            try:
+                wait_for_request_slot()
+                transcript_data = get_transcript_api().fetch(video_id)
+                break
+            except (TranscriptsDisabled, NoTranscriptFound, VideoUnavailable):
+                raise
+            except Exception:
+                if attempt == FETCH_RETRIES:
+                    raise
+                time.sleep(retry_delay(attempt))
         language_used = 'en'
         transcript_type = 'auto'
 
@@ -203,6 +436,8 @@ def get_transcript(video_id, languages=['en', 'en-US', 'en-GB']):
 
     except VideoUnavailable:
         print(f"    Video unavailable: {video_id}")
+        if failures is not None:
+            failures[video_id] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         return {'video_id': video_id, 'error': 'video_unavailable'}
 
     except Exception as e:
@@ -274,9 +509,11 @@ def format_timestamp(seconds):
 # =============================================================================
 
 def update_tutorial_in_db(db, video_id, metadata, transcript_data):
-    """Update a tutorial entry in the database with metadata and transcript info."""
+    """Update every tutorial entry for this video with metadata and transcript info."""
+    found = False
     for tutorial in db['tutorials']:
         if tutorial.get('video_id') == video_id:
+            found = True
             # Update metadata
             if metadata:
                 tutorial['title'] = metadata.get('title')
@@ -301,9 +538,7 @@ def update_tutorial_in_db(db, video_id, metadata, transcript_data):
                 tutorial['has_transcript'] = False
                 tutorial['transcript_error'] = transcript_data.get('error')
 
-            return True
-
-    return False
+    return found
 
 # =============================================================================
 # MAIN PROCESSING
@@ -321,6 +556,7 @@ def process_all_tutorials(skip_existing=True, fetch_transcripts=True):
         return
 
     cache = load_metadata_cache()
+    failures = load_metadata_failures()
     tutorials = db.get('tutorials', [])
 
     if not tutorials:
@@ -329,63 +565,108 @@ def process_all_tutorials(skip_existing=True, fetch_transcripts=True):
 
     print(f"\nFound {len(tutorials)} tutorials in database")
 
-    processed = 0
-    metadata_fetched = 0
-    transcripts_fetched = 0
-    errors = 0
-
-    for i, tutorial in enumerate(tutorials):
-        video_id = tutorial.get('video_id')
-        if not video_id:
+    todo = []
+    skipped = 0
+    for tutorial in tutorials:
+        if not tutorial.get('video_id'):
             continue
-
-        print(f"\n[{i+1}/{len(tutorials)}] Processing: {video_id}")
-
         # Check if already processed
         if skip_existing and tutorial.get('metadata_fetched'):
-            print(f"    Skipping (already has metadata)")
+            skipped += 1
             continue
+        todo.append(tutorial['video_id'])
+    # Tutorials sharing a video are fetched once; the DB update covers all of them
+    todo = list(dict.fromkeys(todo))
+    if skipped:
+        print(f"Skipping {skipped} tutorials that already have metadata")
 
-        # Fetch metadata
-        print(f"    Fetching metadata...")
-        metadata = None
+    # Videos known to be gone get no metadata or transcript request at all;
+    # decided up front, so videos that fail during this run are still reported as failures
+    known_unavailable = {v for v in todo if recently_failed(failures, v)}
 
+    processed = 0
+    metadata_fetched = 0
+    transcripts_fetched = 0
+    errors = 0
+
+    # With an API key, fetch metadata in bulk first; yt-dlp covers what it misses
+    prefetched = {}
+    if YOUTUBE_API_KEY:
+        wanted = [v for v in todo if v not in cache and v not in known_unavailable]
+        if wanted:
+            print(f"Fetching metadata for {len(wanted)} videos from the YouTube API...")
+            prefetched = get_video_metadata_batch(wanted, YOUTUBE_API_KEY)
+
+    def fetch(video_id):
+        """Network part of one tutorial: metadata (unless cached) and transcript."""
+        if video_id in known_unavailable:
+            return None, None
         if video_id in cache:
-            metadata = cache[video_id]
-            print(f"    Using cached metadata: {metadata.get('title', 'Unknown')[:50]}")
+            metadata = None
         else:
-            metadata = get_video_metadata(video_id)
-            if metadata:
-                cache[video_id] = metadata
-                print(f"    Title: {metadata.get('title', 'Unknown')[:50]}")
-                metadata_fetched += 1
-            else:
-                print(f"    Failed to fetch metadata")
-                errors += 1
-
-        # Fetch transcript
-        transcript_data = None
-        if fetch_transcripts:
-            print(f"    Fetching transcript...")
-            transcript_data = get_transcript(video_id)
-
-            if transcript_data and not transcript_data.get('error'):
-                print(f"    Transcript: {transcript_data.get('word_count', 0)} words ({transcript_data.get('transcript_type')})")
-                transcripts_fetched += 1
-
-                # Save transcript file
-                filepath = save_transcript_file(video_id, transcript_data, metadata)
-                print(f"    Saved: {os.path.basename(filepath)}")
-            elif transcript_data and transcript_data.get('error'):
-                print(f"    Transcript error: {transcript_data.get('error')}")
-
-        # Update database
-        update_tutorial_in_db(db, video_id, metadata, transcript_data)
-        processed += 1
+            metadata = prefetched.get(video_id) or get_video_metadata(video_id, failures)
+        transcript_data = get_transcript(video_id, failures=failures) if fetch_transcripts else None
+        return metadata, transcript_data
+
+    # Videos are fetched in parallel; results come back in order, so the
+    # report, transcript files and DB updates below stay sequential
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        results = executor.map(fetch, todo)
+
+        try:
+            for i, (video_id, (metadata, transcript_data)) in enumerate(zip(todo, results)):
+                # Each tutorial's report goes out in one write (workers print their own errors)
+                lines = [f"\n[{i+1}/{len(todo)}] Processing: {video_id}"]
+                log = lines.append
+
+                if video_id in cache:
+                    metadata = cache[video_id]
+                    log(f"    Using cached metadata: {metadata.get('title', 'Unknown')[:50]}")
+                elif metadata:
+                    cache[video_id] = metadata
+                    log(f"    Title: {metadata.get('title', 'Unknown')[:50]}")
+                    metadata_fetched += 1
+                elif video_id in known_unavailable:
+                    log(f"    Skipping (unavailable as of {failures[video_id]})")
+                else:
+                    log(f"    Failed to fetch metadata")
+                    errors += 1
+
+                if transcript_data and not transcript_data.get('error'):
+                    log(f"    Transcript: {transcript_data.get('word_count', 0)} words ({transcript_data.get('transcript_type')})")
+                    transcripts_fetched += 1
+
+                    # Save transcript file
+                    filepath = save_transcript_file(video_id, transcript_data, metadata)
+                    log(f"    Saved: {os.path.basename(filepath)}")
+                elif transcript_data and transcript_data.get('error'):
+                    log(f"    Transcript error: {transcript_data.get('error')}")
+                print('\n'.join(lines))
+
+                # Update database
+                update_tutorial_in_db(db, video_id, metadata, transcript_data)
+                processed += 1
+
+                # Checkpoint so a crash or Ctrl+C doesn't lose the videos fetched so far
+                # (workers may still add failures, so save a copy)
+                if processed % CHECKPOINT_EVERY == 0:
+                    save_db(db)
+                    save_metadata_cache(cache)
+                    save_metadata_failures(dict(failures))
+        except KeyboardInterrupt:
+            # Drop the queued videos instead of waiting out the rate limiter for all
+            # of them, and keep what was fetched so far
+            print("\nInterrupted - saving progress...")
+            executor.shutdown(wait=False, cancel_futures=True)
+            save_db(db)
+            save_metadata_cache(cache)
+            save_metadata_failures(dict(failures))
+            raise
 
     # Save everything
     save_db(db)
     save_metadata_cache(cache)
+    save_metadata_failures(failures)
 
     print("\n" + "=" * 70)
     print("SUMMARY")
@@ -443,21 +724,30 @@ def process_single_video(video_id_or_url):
 
 def show_stats():
     """Show statistics about fetched transcripts."""
-    db = load_db()
-    if not db:
+    tutorials = iter_tutorials()
+    if tutorials is None:
         print("ERROR: Could not load database")
         return
 
-    tutorials = db.get('tutorials', [])
-
-    with_metadata = sum(1 for t in tutorials if t.get('metadata_fetched'))
-    with_transcript = sum(1 for t in tutorials if t.get('has_transcript'))
-    total_words = sum(t.get('transcript_word_count', 0) for t in tutorials)
+    # One pass, keeping only what the transcript listing needs
+    total = 0
+    with_metadata = 0
+    total_words = 0
+    transcript_rows = []
+    for t in tutorials:
+        total += 1
+        if t.get('metadata_fetched'):
+            with_metadata += 1
+        total_words += t.get('transcript_word_count', 0)
+        if t.get('has_transcript'):
+            transcript_rows.append((t.get('title', t.get('video_id', 'Unknown'))[:40],
+                                    t.get('transcript_word_count', 0)))
+    with_transcript = len(transcript_rows)
 
     print("\n" + "=" * 50)
     print("YOUTUBE TRANSCRIPT STATISTICS")
     print("=" * 50)
-    print(f"  Total tutorials:     {len(tutorials)}")
+    print(f"  Total tutorials:     {total}")
     print(f"  With metadata:       {with_metadata}")
     print(f"  With transcripts:    {with_transcript}")
     print(f"  Total transcript words: {total_words:,}")
@@ -467,11 +757,8 @@ def show_stats():
         print("\n" + "-" * 50)
         print("TUTORIALS WITH TRANSCRIPTS")
         print("-" * 50)
-        for t in tutorials:
-            if t.get('has_transcript'):
-                title = t.get('title', t.get('video_id', 'Unknown'))[:40]
-                words = t.get('transcript_word_count', 0)
-                print(f"  - {title}: {words:,} words")
+        for title, words in transcript_rows:
+            print(f"  - {title}: {words:,} words")
 
 # =============================================================================
 # CLI